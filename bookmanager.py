@@ -23,6 +23,7 @@ Usage:
 """
 
 import json
+import time
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 from pathlib import Path
@@ -153,12 +154,13 @@ class BookManager:
         └── progress/        # 学习进度（读写）
     """
 
-    def __init__(self, data_dir: Path = None):
+    def __init__(self, data_dir: Path = None, cache_ttl: float = 60.0):
         """
         初始化词书管理器
 
         Args:
             data_dir: 数据目录路径，默认为脚本同级的 data/ 目录
+            cache_ttl: 缓存校验间隔（秒），超过后才重新检查词书文件是否被修改
         """
         if data_dir is None:
             data_dir = Path(__file__).parent / "data"
@@ -169,6 +171,13 @@ class BookManager:
 
         # 缓存已加载的词书
         self._cache: Dict[str, List[Word]] = {}
+        # 缓存对应的文件修改时间 / 上次校验时间（用于 TTL 内免 stat，过期后按 mtime 失效）
+        self.cache_ttl = cache_ttl
+        self._cache_mtime: Dict[str, float] = {}
+        self._cache_checked: Dict[str, float] = {}
+        # 加载时预建索引：小写单词 → Word，单元 → 单词列表
+        self._word_index: Dict[str, Dict[str, Word]] = {}
+        self._unit_index: Dict[str, Dict[str, List[Word]]] = {}
 
     def list_books(self) -> List[str]:
         """
@@ -195,13 +204,24 @@ class BookManager:
         Raises:
             FileNotFoundError: 词书文件不存在
         """
+        now = time.monotonic()
         if use_cache and book_name in self._cache:
-            return self._cache[book_name]
+            # TTL 内直接命中内存，不触碰磁盘
+            if now - self._cache_checked[book_name] < self.cache_ttl:
+                return self._cache[book_name]
 
         book_file = self.books_dir / f"{book_name}.json"
-        if not book_file.exists():
+        try:
+            mtime = book_file.stat().st_mtime
+        except FileNotFoundError:
+            self._evict(book_name)
             raise FileNotFoundError(f"词书不存在: {book_file}")
 
+        # TTL 过期：文件未修改则继续使用缓存
+        if use_cache and self._cache_mtime.get(book_name) == mtime:
+            self._cache_checked[book_name] = now
+            return self._cache[book_name]
+
         with open(book_file, "r", encoding="utf-8") as f:
             data = json.load(f)
 
@@ -209,9 +229,45 @@ class BookManager:
 
         if use_cache:
             self._cache[book_name] = words
+            self._cache_mtime[book_name] = mtime
+            self._cache_checked[book_name] = now
+            self._build_index(book_name, words)
 
         return words
 
+    def _build_index(self, book_name: str, words: List[Word]):
+        """构建单词索引和单元索引（同名单词保留首次出现的条目）"""
+        word_index: Dict[str, Word] = {}
+        unit_index: Dict[str, List[Word]] = {}
+        for w in words:
+            word_index.setdefault(w.word.lower(), w)
+            unit_index.setdefault(w.unit, []).append(w)
+        self._word_index[book_name] = word_index
+        self._unit_index[book_name] = unit_index
+
+    def _evict(self, book_name: str):
+        """移除词书缓存"""
+        self._cache.pop(book_name, None)
+        self._cache_mtime.pop(book_name, None)
+        self._cache_checked.pop(book_name, None)
+        self._word_index.pop(book_name, None)
+        self._unit_index.pop(book_name, None)
+
+    def count_words(self, book_name: str) -> int:
+        """
+        获取词书单词数（走缓存）
+
+        Args:
+            book_name: 词书名称
+
+        Returns:
+            单词数量，词书不存在返回 0
+        """
+        try:
+            return len(self.load(book_name))
+        except FileNotFoundError:
+            return 0
+
     def get_word(self, book_name: str, word: str) -> Optional[Word]:
         """
         获取单个单词信息
@@ -223,12 +279,8 @@ class BookManager:
         Returns:
             Word 对象，如果未找到返回 None
         """
-        words = self.load(book_name)
-        word_lower = word.lower()
-        for w in words:
-            if w.word.lower() == word_lower:
-                return w
-        return None
+        self.load(book_name)
+        return self._word_index[book_name].get(word.lower())
 
     def get_words_by_unit(self, book_name: str, unit: str) -> List[Word]:
         """
@@ -239,10 +291,23 @@ class BookManager:
             unit: 单元名称
 
         Returns:
-            该单元的单词列表
+            该单元的单词列表（缓存中的列表，调用方不要修改）
         """
-        words = self.load(book_name)
-        return [w for w in words if w.unit == unit]
+        self.load(book_name)
+        return self._unit_index[book_name].get(unit, [])
+
+    def get_unit_groups(self, book_name: str) -> Dict[str, List[Word]]:
+        """
+        获取按单元分组的单词（加载时预建的索引）
+
+        Args:
+            book_name: 词书名称
+
+        Returns:
+            单元名称 → 单词列表（按出现顺序，缓存中的数据，调用方不要修改）
+        """
+        self.load(book_name)
+        return self._unit_index[book_name]
 
     def get_units(self, book_name: str) -> List[str]:
         """
@@ -254,14 +319,8 @@ class BookManager:
         Returns:
             单元名称列表（按出现顺序）
         """
-        words = self.load(book_name)
-        seen = set()
-        units = []
-        for w in words:
-            if w.unit and w.unit not in seen:
-                seen.add(w.unit)
-                units.append(w.unit)
-        return units
+        self.load(book_name)
+        return [u for u in self._unit_index[book_name] if u]
 
     def get_progress_file(self, book_name: str) -> Path:
         """
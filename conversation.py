@@ -20,10 +20,12 @@ Usage:
 """
 
 import uuid
-import json
 import os
 import httpx
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
+
+from httputil import HTTP2_AVAILABLE
+from jsonutil import json_dumps, json_loads, parse_llm_json
 
 
 class ConversationManager:
@@ -33,6 +35,12 @@ class ConversationManager:
         self.api_key = os.getenv("DASHSCOPE_API_KEY")
         self.base_url = "https://dashscope.aliyuncs.com/compatible-mode/v1"
         self.model = "qwen-plus"
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # 持久 HTTP 客户端（首次调用时创建，复用 TCP/TLS 连接）
+        self._client: Optional[httpx.AsyncClient] = None
 
         # 内存中存储对话状态（生产环境应使用数据库）
         self.conversations: Dict[str, dict] = {}
@@ -41,6 +49,18 @@ class ConversationManager:
         """检查服务是否可用"""
         return bool(self.api_key)
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """获取持久 HTTP 客户端"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(proxy=None, timeout=30.0, http2=HTTP2_AVAILABLE)
+        return self._client
+
+    async def aclose(self):
+        """关闭 HTTP 客户端（应用关闭时调用）"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def _call_qwen(self, system_prompt: str, user_prompt: str, history: List[Dict] = None) -> dict:
         """调用阿里云百炼 Qwen-Plus API
 
@@ -66,30 +86,22 @@ class ConversationManager:
         # 添加当前用户消息
         messages.append({"role": "user", "content": user_prompt})
 
-        async with httpx.AsyncClient(proxy=None, timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": 0.7,
-                    "max_tokens": 500
-                }
-            )
-            if response.status_code == 200:
-                content = response.json()["choices"][0]["message"]["content"]
-                # 解析 JSON（处理可能的 markdown 代码块）
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                return json.loads(content)
-            else:
-                raise Exception(f"API error: {response.status_code} - {response.text}")
+        response = await self._get_client().post(
+            f"{self.base_url}/chat/completions",
+            headers=self._headers,
+            json={
+                "model": self.model,
+                "messages": messages,
+                "temperature": 0.7,
+                "max_tokens": 500
+            }
+        )
+        if response.status_code == 200:
+            content = json_loads(response.content)["choices"][0]["message"]["content"]
+            # 解析 JSON（处理可能的 markdown 代码块）
+            return parse_llm_json(content)
+        else:
+            raise Exception(f"API error: {response.status_code} - {response.text}")
 
     def _calculate_rounds(self, word_count: int) -> int:
         """根据单词数量计算对话轮数"""
@@ -191,7 +203,7 @@ class ConversationManager:
             "scenario": result.get("scenario", ""),
             "history": [],  # 学生回复历史
             "llm_history": [  # LLM 对话历史（用于保持上下文）
-                {"role": "assistant", "content": json.dumps(result, ensure_ascii=False)}
+                {"role": "assistant", "content": json_dumps(result)}
             ],
             "words_used": set(),
             "all_target_words": result.get("target_words", [])
@@ -345,7 +357,7 @@ class ConversationManager:
         # 保存 LLM 回复到历史
         conv["llm_history"].append({
             "role": "assistant",
-            "content": json.dumps(result, ensure_ascii=False)
+            "content": json_dumps(result)
         })
 
         result["round"] = current_round + 1
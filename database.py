@@ -14,7 +14,7 @@ from datetime import datetime, timedelta
 from typing import Optional, List
 from pathlib import Path
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, Text, DateTime, ForeignKey, UniqueConstraint, func, case
+from sqlalchemy import create_engine, Column, Integer, String, Float, Text, DateTime, ForeignKey, UniqueConstraint, func, case, insert, update
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
 
@@ -28,7 +28,14 @@ PROJECT_ROOT = Path(__file__).parent
 DATABASE_PATH = PROJECT_ROOT / "data" / "app.db"
 
 # 创建数据库引擎
-engine = create_engine(f"sqlite:///{DATABASE_PATH}", echo=False)
+# 连接池放大以支撑仪表盘并发统计查询（线程池中执行，需允许跨线程使用连接）
+engine = create_engine(
+    f"sqlite:///{DATABASE_PATH}",
+    echo=False,
+    pool_size=20,
+    max_overflow=10,
+    connect_args={"check_same_thread": False}
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -308,6 +315,18 @@ def get_db():
         db.close()
 
 
+def run_with_session(func, *args, **kwargs):
+    """用独立会话执行查询函数 func(db, ...)
+
+    Session 不是线程安全的，并发（线程池）执行多个查询时每个查询需要各自的会话。
+    """
+    db = SessionLocal()
+    try:
+        return func(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
 # ==================== 密码哈希 ====================
 
 def hash_password(password: str) -> str:
@@ -516,6 +535,23 @@ def get_user_progress(db: Session, user_id: int, book_id: str) -> List[Progress]
     ).all()
 
 
+def get_user_progress_projection(db: Session, user_id: int, book_id: str, *cols) -> list:
+    """
+    只查询指定列的学习进度（返回 Row 元组，不构建 ORM 对象）
+
+    示例：get_user_progress_projection(db, uid, book_id, Progress.word, Progress.due)
+    """
+    return db.query(*cols).filter(
+        Progress.user_id == user_id,
+        Progress.book_id == book_id
+    ).all()
+
+
+def get_learned_word_set(db: Session, user_id: int, book_id: str) -> set:
+    """获取用户在某本词书已学单词集合"""
+    return {word for (word,) in get_user_progress_projection(db, user_id, book_id, Progress.word)}
+
+
 def get_word_progress(db: Session, user_id: int, book_id: str, word: str) -> Optional[Progress]:
     """获取用户对某个单词的学习进度"""
     return db.query(Progress).filter(
@@ -596,11 +632,8 @@ def get_due_cards(db: Session, user_id: int, book_id: str = None,
     if book_id:
         query = query.filter(Progress.book_id == book_id)
 
-    all_cards = query.order_by(Progress.due.asc()).all()
-
-    # 从最紧急的开始取，直到达到目标
-    target = min(daily_target, len(all_cards))
-    result = all_cards[:target]
+    # 从最紧急的开始取，直到达到目标（排序和截断都交给 SQL，不加载其余卡片）
+    result = query.order_by(Progress.due.asc()).limit(daily_target).all()
 
     # 打乱顺序（防止学生从顺序猜到难度档位）
     random.shuffle(result)
@@ -1149,8 +1182,8 @@ def add_pronunciation_record(db: Session, user_id: int, book_id: str, word: str,
                               audio_path: str, accuracy_score: float,
                               pronunciation_score: float, fluency_score: float,
                               completeness_score: float, recognized_text: str,
-                              phoneme_details: str) -> PronunciationRecord:
-    """添加发音评估记录"""
+                              phoneme_details: str, commit: bool = True) -> PronunciationRecord:
+    """添加发音评估记录（commit=False 时只加入会话，由调用方与后续写入一起提交）"""
     record = PronunciationRecord(
         user_id=user_id,
         book_id=book_id,
@@ -1164,8 +1197,9 @@ def add_pronunciation_record(db: Session, user_id: int, book_id: str, word: str,
         phoneme_details=phoneme_details
     )
     db.add(record)
-    db.commit()
-    db.refresh(record)
+    if commit:
+        db.commit()
+        db.refresh(record)
     return record
 
 
@@ -1205,52 +1239,62 @@ def update_phoneme_errors(db: Session, user_id: int, phoneme_details: List[dict]
             stats["errors"] += 1
             stats["error_types"][error_type] = stats["error_types"].get(error_type, 0) + 1
 
-    # 批量获取所有现有记录（一次查询代替 N 次查询）
-    phonemes_to_update = list(phoneme_stats.keys())
-    existing_records = db.query(PhonemeError).filter(
+    # 批量获取所有现有记录（一次查询代替 N 次查询，只取需要的列）
+    existing_rows = db.query(
+        PhonemeError.id, PhonemeError.phoneme, PhonemeError.total_attempts,
+        PhonemeError.error_count, PhonemeError.avg_accuracy, PhonemeError.error_types
+    ).filter(
         PhonemeError.user_id == user_id,
-        PhonemeError.phoneme.in_(phonemes_to_update)
+        PhonemeError.phoneme.in_(list(phoneme_stats))
     ).all()
-    existing_map = {r.phoneme: r for r in existing_records}
+    existing_map = {r.phoneme: r for r in existing_rows}
 
-    # 批量处理
-    new_records = []
+    # 组装批量更新/插入的参数（各一条 executemany，而不是逐个 ORM 对象 flush）
+    now = datetime.utcnow()
+    update_rows = []
+    insert_rows = []
     for phoneme, stats in phoneme_stats.items():
-        error_record = existing_map.get(phoneme)
+        row = existing_map.get(phoneme)
 
-        if error_record:
+        if row:
             # 更新统计
-            old_total = error_record.total_attempts
+            old_total = row.total_attempts or 0
             new_total = old_total + stats["attempts"]
-            error_record.total_attempts = new_total
-            error_record.error_count += stats["errors"]
+            values = {
+                "id": row.id,
+                "total_attempts": new_total,
+                "error_count": (row.error_count or 0) + stats["errors"],
+                # 更新平均准确度（加权平均）
+                "avg_accuracy": ((row.avg_accuracy or 0.0) * old_total + stats["total_accuracy"]) / new_total,
+                "updated_at": now
+            }
 
             # 更新错误类型统计
             if stats["errors"] > 0:
-                error_types = json.loads(error_record.error_types or "{}")
+                error_types = json.loads(row.error_types or "{}")
                 for et, count in stats["error_types"].items():
                     error_types[et] = error_types.get(et, 0) + count
-                error_record.error_types = json.dumps(error_types)
+                values["error_types"] = json.dumps(error_types)
+            else:
+                values["error_types"] = row.error_types
 
-            # 更新平均准确度（加权平均）
-            error_record.avg_accuracy = (
-                error_record.avg_accuracy * old_total + stats["total_accuracy"]
-            ) / new_total
+            update_rows.append(values)
         else:
             # 创建新记录
-            avg_accuracy = stats["total_accuracy"] / stats["attempts"]
-            new_records.append(PhonemeError(
-                user_id=user_id,
-                phoneme=phoneme,
-                total_attempts=stats["attempts"],
-                error_count=stats["errors"],
-                avg_accuracy=avg_accuracy,
-                error_types=json.dumps(stats["error_types"])
-            ))
-
-    # 批量添加新记录
-    if new_records:
-        db.add_all(new_records)
+            insert_rows.append({
+                "user_id": user_id,
+                "phoneme": phoneme,
+                "total_attempts": stats["attempts"],
+                "error_count": stats["errors"],
+                "avg_accuracy": stats["total_accuracy"] / stats["attempts"],
+                "error_types": json.dumps(stats["error_types"]),
+                "updated_at": now
+            })
+
+    if update_rows:
+        db.execute(update(PhonemeError), update_rows)
+    if insert_rows:
+        db.execute(insert(PhonemeError), insert_rows)
 
     # 一次提交
     db.commit()
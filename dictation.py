@@ -40,6 +40,7 @@ from typing import List, Optional, Dict
 from pathlib import Path
 
 from bookmanager import BookManager, Word
+from jsonutil import parse_llm_json
 
 # 加载环境变量
 try:
@@ -522,11 +523,7 @@ def generate_example_sentence(word: str, translation: str) -> Optional[Dict]:
             result = response.json()
             content = result["choices"][0]["message"]["content"]
             # 解析 JSON（处理可能的 markdown 代码块）
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            return json.loads(content)
+            return parse_llm_json(content)
     except Exception as e:
         pass
 
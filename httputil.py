@@ -0,0 +1,17 @@
+"""
+HTTP 客户端工具模块
+
+server / speech / conversation 创建 httpx.AsyncClient 时共用的可选依赖探测。
+
+Usage:
+    from httputil import HTTP2_AVAILABLE
+
+    client = httpx.AsyncClient(http2=HTTP2_AVAILABLE)
+"""
+
+# h2 可选（httpx 的 HTTP/2 支持；安装后同一连接可并发多个请求，未安装时使用 HTTP/1.1）
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
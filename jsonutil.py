@@ -0,0 +1,51 @@
+"""
+JSON 工具模块
+
+server / speech / conversation / dictation 共用：
+- orjson 可选（C 扩展，解析/序列化比标准库快数倍；未安装时回退标准库）
+- LLM 回复中 markdown 代码块的提取与解析
+
+Usage:
+    from jsonutil import json_loads, parse_llm_json
+
+    data = json_loads(response.content)
+    result = parse_llm_json(data["choices"][0]["message"]["content"])
+"""
+
+import json
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# 匹配 LLM 回复中的 markdown 代码块（```json ... ``` 或 ``` ... ```）
+FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
+
+def json_loads(data):
+    """解析 JSON（str 或 bytes），优先使用 orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """序列化为 JSON 字符串（保留非 ASCII 字符），优先使用 orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def strip_fence(content: str) -> str:
+    """提取 LLM 回复中的 JSON 文本（有代码块取代码块内容，否则去掉首尾空白）"""
+    m = FENCE_RE.search(content)
+    return m.group(1) if m else content.strip()
+
+
+def parse_llm_json(content: str):
+    """解析 LLM 回复中的 JSON（有代码块取代码块内容）"""
+    return json_loads(strip_fence(content))
@@ -15,7 +15,8 @@ Usage:
     result = merge_assessment_with_letters("pretty", azure_phoneme_details)
 """
 
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 
 
 class PhonemeMapper:
@@ -24,6 +25,8 @@ class PhonemeMapper:
     def __init__(self):
         self.transducer = None
         self._init_transducer()
+        # g2p 转换是纯 Python 规则匹配，较慢；同一单词的对齐结果固定，按单词缓存
+        self._alignments = lru_cache(maxsize=4096)(self._compute_alignments)
 
     def _init_transducer(self):
         """初始化 g2p 转换器"""
@@ -74,25 +77,26 @@ class PhonemeMapper:
         if not self.is_available():
             return []
 
-        word_lower = word.lower()
-        result = self.transducer(word_lower)
+        return [
+            {'letter': letter_group, 'phoneme': phoneme, 'char_start': start, 'char_end': end}
+            for letter_group, phoneme, start, end in self._alignments(word.lower())
+        ]
 
-        # 使用 substring_alignments 获取对齐
-        alignments = result.substring_alignments()
+    def _compute_alignments(self, word_lower: str) -> Tuple[Tuple[str, str, int, int], ...]:
+        """
+        调用 g2p 计算对齐（结果为不可变元组，供缓存共享）
 
-        mapping = []
+        每项为 (字母组, 音素, 起始位置, 结束位置)，字符位置随对齐一起缓存，不必每次重算
+        """
+        result = self.transducer(word_lower)
+        # 使用 substring_alignments 获取对齐
+        alignments = []
         char_pos = 0
-
-        for letter_group, phoneme in alignments:
-            mapping.append({
-                'letter': letter_group,
-                'phoneme': phoneme,
-                'char_start': char_pos,
-                'char_end': char_pos + len(letter_group)
-            })
-            char_pos += len(letter_group)
-
-        return mapping
+        for letter_group, phoneme in result.substring_alignments():
+            end = char_pos + len(letter_group)
+            alignments.append((letter_group, phoneme, char_pos, end))
+            char_pos = end
+        return tuple(alignments)
 
     def merge_with_assessment(self, word: str, phoneme_details: List[Dict]) -> List[Dict]:
         """
@@ -109,40 +113,41 @@ class PhonemeMapper:
         Returns:
             合并后的映射，每项包含 letter, phoneme, accuracy, error_type
         """
-        letter_mapping = self.get_letter_mapping(word)
-
-        if not letter_mapping:
+        if not self.is_available():
             return []
 
+        alignments = self._alignments(word.lower())
+
         if not phoneme_details:
             # 没有评估数据，只返回字母映射
-            for item in letter_mapping:
-                item['accuracy'] = None
-                item['error_type'] = None
-            return letter_mapping
+            return [
+                {'letter': letter_group, 'phoneme': phoneme, 'char_start': start, 'char_end': end,
+                 'accuracy': None, 'error_type': None}
+                for letter_group, phoneme, start, end in alignments
+            ]
 
         # 按顺序对齐 Azure 音素和 g2p 音素
-        # 由于音素数量可能不完全匹配，使用顺序对齐
-        assessment_idx = 0
-
-        for item in letter_mapping:
-            g2p_phoneme = item['phoneme']
+        # 由于音素数量可能不完全匹配，使用顺序对齐；一次遍历直接生成结果
+        assessments = iter(phoneme_details)
+        letter_mapping = []
 
-            if not g2p_phoneme:
+        for letter_group, phoneme, start, end in alignments:
+            if not phoneme:
                 # 静音字母
-                item['accuracy'] = 100
-                item['error_type'] = 'None'
-                continue
-
-            if assessment_idx < len(phoneme_details):
-                azure_data = phoneme_details[assessment_idx]
-                item['accuracy'] = azure_data.get('accuracy', 0)
-                item['error_type'] = azure_data.get('error_type', 'None')
-                assessment_idx += 1
+                accuracy, error_type = 100, 'None'
             else:
-                # 没有更多评估数据
-                item['accuracy'] = None
-                item['error_type'] = None
+                azure_data = next(assessments, None)
+                if azure_data is not None:
+                    accuracy = azure_data.get('accuracy', 0)
+                    error_type = azure_data.get('error_type', 'None')
+                else:
+                    # 没有更多评估数据
+                    accuracy = error_type = None
+
+            letter_mapping.append({
+                'letter': letter_group, 'phoneme': phoneme, 'char_start': start, 'char_end': end,
+                'accuracy': accuracy, 'error_type': error_type
+            })
 
         return letter_mapping
 
@@ -21,23 +21,39 @@ except ImportError:
 for _proxy_key in ['http_proxy', 'https_proxy', 'HTTP_PROXY', 'HTTPS_PROXY', 'all_proxy', 'ALL_PROXY']:
     os.environ.pop(_proxy_key, None)
 
+import re
 import json
+import asyncio
+import hashlib
+import heapq
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
-from typing import Optional, List
+from operator import itemgetter
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, List, BinaryIO, Tuple
 from pathlib import Path
+from queue import SimpleQueue
 
+import anyio
+from cachetools import TTLCache
 from fastapi import FastAPI, Request, Depends, HTTPException, status, Form, Response, UploadFile, File, BackgroundTasks
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, RedirectResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
 # 本地模块
 from database import (
-    init_db, get_db, Session,
+    init_db, get_db, run_with_session, Session,
     create_user, authenticate_user, get_user_by_id,
     create_token, verify_token,
-    get_user_progress, update_progress, get_due_cards, get_daily_target_range,
+    get_user_progress_projection, get_learned_word_set, update_progress, get_due_cards, get_daily_target_range,
     add_history, get_user_stats, get_words_history_stats,
     ConfusingWords, ConfusionRecord, User, Progress
 )
@@ -63,13 +79,20 @@ try:
 except ImportError:
     QWEN_AVAILABLE = False
 
+# h2（httpx 的 HTTP/2 支持；安装后同一连接可并发多个 Qwen 请求）
+from httputil import HTTP2_AVAILABLE
+
+# orjson 可选；JSON 解析/序列化与 LLM 回复代码块提取（各模块共用）
+from jsonutil import ORJSON_AVAILABLE, orjson, json_dumps, json_loads, strip_fence
+
 # Conversation and Speech modules
 from conversation import ConversationManager
 from speech import (
     SpeechRecognizer, PronunciationAssessor,
     generate_feedback_text, generate_ai_feedback, ACCURACY_THRESHOLD,
     QwenChineseSpeechRecognizer, QwenEnglishSpeechRecognizer,
-    generate_translation_feedback, calculate_text_similarity
+    generate_translation_feedback, evaluate_passage_translation, calculate_text_similarity,
+    close_http_client as close_speech_http_client
 )
 
 # Database models for pronunciation
@@ -82,6 +105,9 @@ from database import (
 # Phoneme to letter mapping
 from phoneme_mapper import merge_assessment_with_letters
 
+# 阅读理解提示词
+from prompts.api_prompts import get_random_reading_prompt, TOPIC_POOLS
+
 # 全局实例
 conv_manager = ConversationManager()
 speech_recognizer = SpeechRecognizer()
@@ -95,21 +121,76 @@ STATIC_DIR = PROJECT_ROOT / "static"
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
 AUDIO_CACHE_DIR = STATIC_DIR / "audio"
 
-# 确保目录存在
-STATIC_DIR.mkdir(exist_ok=True)
-TEMPLATES_DIR.mkdir(exist_ok=True)
-AUDIO_CACHE_DIR.mkdir(exist_ok=True)
 RECORDINGS_DIR = STATIC_DIR / "recordings"
-RECORDINGS_DIR.mkdir(exist_ok=True)
+_RECORDINGS_DIR_STR = str(RECORDINGS_DIR)  # 录音保存热路径使用字符串路径，避免 Path 对象开销
 
 # 初始化统一 TTS 服务
 tts_service = init_tts_service(AUDIO_CACHE_DIR)
 
+
+# ==================== 日志 ====================
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.getenv("LOG_LEVEL", "WARNING").upper())
+
+
+def _setup_log_queue():
+    """
+    日志经 QueueHandler 入队，由后台线程 QueueListener 写 stderr，请求处理中不做同步 I/O
+
+    级别由 LOG_LEVEL 控制（默认 WARNING，生产环境下 debug 日志直接跳过格式化）
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, QueueHandler) for h in root.handlers):
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    log_queue = SimpleQueue()
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    root.addHandler(QueueHandler(log_queue))
+
+
+_setup_log_queue()
+
+
+# ==================== JSON 工具 ====================
+
+# 超过该字节数的 JSON 放到线程池解析，避免长 LLM 回复阻塞事件循环
+JSON_OFFLOAD_THRESHOLD = 8192
+
+
+async def _json_loads_async(data):
+    """解析 JSON，较大的内容交给线程池，较小的直接解析（线程切换开销更大）"""
+    if len(data) > JSON_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(json_loads, data)
+    return json_loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """默认响应类：使用 orjson 直接输出 UTF-8 字节，未安装时回退 JSONResponse"""
+
+    def render(self, content) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+
+class AudioFileResponse(FileResponse):
+    """
+    音频文件响应：服务器支持 ASGI pathsend 扩展时按路径零拷贝发送；
+    否则以 1MB 分块读取（默认 64KB），大文件减少线程池往返和 send 次数
+    """
+
+    chunk_size = 1024 * 1024
+
+
 # 创建应用
-app = FastAPI(title="英语学习应用", version="1.0.0")
+app = FastAPI(title="英语学习应用", version="1.0.0", default_response_class=FastJSONResponse)
 
-# 挂载静态文件
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+# 挂载静态文件（目录在启动事件中创建，这里不检查）
+app.mount("/static", StaticFiles(directory=str(STATIC_DIR), check_dir=False), name="static")
 
 # 模板引擎
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
@@ -117,11 +198,32 @@ templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 # 词书管理器
 book_manager = BookManager()
 
-# 同义词索引（基于所有词书构建，按学段过滤）
-synonym_index = SynonymIndex(book_manager)
-
-# 初始化数据库
-init_db()
+# 同义词索引（基于所有词书构建，按学段过滤；启动事件中预先构建，未经启动事件时首次使用再构建）
+_synonym_index: Optional[SynonymIndex] = None
+_synonym_index_lock = threading.Lock()
+
+
+def get_synonym_index() -> SynonymIndex:
+    """获取同义词索引：通常已在启动事件中构建；启动事件未运行时（如脚本导入 app、未进入上下文的 TestClient）在首次使用时构建"""
+    global _synonym_index
+    if _synonym_index is None:
+        with _synonym_index_lock:
+            if _synonym_index is None:
+                _synonym_index = SynonymIndex(book_manager)
+    return _synonym_index
+
+
+@app.on_event("startup")
+async def startup_init():
+    """启动时创建目录、初始化数据库、构建同义词索引（在线程池中并行执行，不阻塞事件循环）"""
+    await asyncio.gather(*(
+        asyncio.to_thread(d.mkdir, parents=True, exist_ok=True)
+        for d in (STATIC_DIR, TEMPLATES_DIR, RECORDINGS_DIR, AUDIO_CACHE_DIR)
+    ))
+    await asyncio.gather(
+        asyncio.to_thread(init_db),
+        asyncio.to_thread(get_synonym_index)
+    )
 
 
 # ==================== Pydantic 模型 ====================
@@ -190,6 +292,10 @@ class ExampleRequest(BaseModel):
     translation: str
 
 
+class ExampleBatchRequest(BaseModel):
+    items: List[ExampleRequest]
+
+
 class MemoryTipRequest(BaseModel):
     word: str
     translation: str
@@ -216,6 +322,12 @@ class ConversationReplyRequest(BaseModel):
 
 # ==================== 认证依赖 ====================
 
+# 已验证 token → (过期时间戳, 用户信息)：短时间内重复请求免去验签和查库
+_auth_user_cache = TTLCache(maxsize=4096, ttl=60)
+# get_current_user 是同步依赖，在线程池中并发执行；TTLCache 非线程安全，读写需加锁
+_auth_user_cache_lock = threading.Lock()
+
+
 def get_current_user(request: Request, db: Session = Depends(get_db)) -> Optional[dict]:
     """从 Cookie 或 Header 获取当前用户"""
     # 优先从 Cookie 获取
@@ -230,6 +342,11 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> Optiona
     if not token:
         return None
 
+    with _auth_user_cache_lock:
+        cached = _auth_user_cache.get(token)
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
+
     payload = verify_token(token)
     if not payload:
         return None
@@ -238,7 +355,10 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> Optiona
     if not user:
         return None
 
-    return {"id": user.id, "username": user.username, "grade": user.grade}
+    current = {"id": user.id, "username": user.username, "grade": user.grade}
+    with _auth_user_cache_lock:
+        _auth_user_cache[token] = (payload["exp"], current)
+    return current
 
 
 def require_auth(request: Request, db: Session = Depends(get_db)):
@@ -487,7 +607,6 @@ async def api_register(data: UserCreate, db: Session = Depends(get_db)):
     if data.city and len(data.city) < 2:
         raise HTTPException(status_code=400, detail="请选择城市")
 
-    import re
     phone_pattern = r'^1[3-9]\d{9}$'
     if data.phone and not re.match(phone_pattern, data.phone):
         raise HTTPException(status_code=400, detail="请输入有效的手机号")
@@ -564,14 +683,22 @@ async def api_me(user: dict = Depends(require_auth)):
 
 # ==================== 注册辅助 API ====================
 
+# 省市数据（静态文件，首次请求时在线程池读取后常驻内存）
+_regions_data = None
+
+
 @app.get("/api/regions")
 async def api_regions():
     """获取省市数据"""
-    regions_file = STATIC_DIR / "data" / "regions.json"
-    if regions_file.exists():
-        with open(regions_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {"provinces": []}
+    global _regions_data
+    if _regions_data is None:
+        regions_file = STATIC_DIR / "data" / "regions.json"
+        try:
+            raw = await asyncio.to_thread(regions_file.read_bytes)
+        except FileNotFoundError:
+            return {"provinces": []}
+        _regions_data = await _json_loads_async(raw)
+    return _regions_data
 
 
 @app.get("/api/grades")
@@ -662,18 +789,15 @@ async def api_book_units_stats(
         raise HTTPException(status_code=404, detail="词书不存在")
 
     # 获取用户进度
-    progress_list = get_user_progress(db, user["id"], book_id)
-    learned_words = {p.word for p in progress_list}
+    learned_words = get_learned_word_set(db, user["id"], book_id)
 
-    # 按单元统计
+    # 按单元统计（直接使用词书的单元索引）
     unit_stats = {}
-    for word in words:
-        unit = word.unit or "未分类"
-        if unit not in unit_stats:
-            unit_stats[unit] = {"name": unit, "total_count": 0, "learned_count": 0}
-        unit_stats[unit]["total_count"] += 1
-        if word.word in learned_words:
-            unit_stats[unit]["learned_count"] += 1
+    for unit, unit_words in book_manager.get_unit_groups(book_id).items():
+        name = unit or "未分类"
+        stats = unit_stats.setdefault(name, {"name": name, "total_count": 0, "learned_count": 0})
+        stats["total_count"] += len(unit_words)
+        stats["learned_count"] += sum(1 for w in unit_words if w.word in learned_words)
 
     # 排序并返回
     units = sorted(unit_stats.values(), key=lambda x: x["name"])
@@ -698,13 +822,12 @@ async def api_book_learned_words(
 
     # 过滤指定单元的单词
     if data.units:
-        unit_words = [w for w in words if w.unit in data.units]
+        unit_words = [w for u in dict.fromkeys(data.units) for w in book_manager.get_words_by_unit(book_id, u)]
     else:
         unit_words = words
 
     # 获取用户进度
-    progress_list = get_user_progress(db, user["id"], book_id)
-    learned_set = {p.word for p in progress_list}
+    learned_set = get_learned_word_set(db, user["id"], book_id)
 
     # 筛选已学单词
     learned_words = [
@@ -713,7 +836,7 @@ async def api_book_learned_words(
         if w.word in learned_set
     ]
 
-    return {"words": learned_words, "count": len(learned_words)}
+    return FastJSONResponse({"words": learned_words, "count": len(learned_words)})
 
 
 @app.get("/api/books/{book_id}/words")
@@ -730,25 +853,26 @@ async def api_book_words(
 
     # 过滤单元
     if unit:
-        words = [w for w in words if w.unit == unit]
+        words = book_manager.get_words_by_unit(book_id, unit)
 
     # 获取用户进度
-    progress_list = get_user_progress(db, user["id"], book_id)
-    progress_map = {p.word: p for p in progress_list}
+    due_map = dict(get_user_progress_projection(db, user["id"], book_id, Progress.word, Progress.due))
 
     result = []
     for word in words:
-        p = progress_map.get(word.word)
+        learned = word.word in due_map
+        due = due_map.get(word.word)
         result.append({
             "word": word.word,
             "phonetic": word.phonetic,
             "translation": word.translation,
             "unit": word.unit,
-            "learned": p is not None,
-            "due": p.due.isoformat() if p and p.due else None
+            "learned": learned,
+            "due": due.isoformat() if due else None
         })
 
-    return {"words": result}
+    # 单词列表可达数千项：直接构造响应，跳过 FastAPI 的 jsonable_encoder 逐项遍历
+    return FastJSONResponse({"words": result})
 
 
 # ==================== 学习会话 API ====================
@@ -830,10 +954,10 @@ async def api_session_start(
                     })
 
         random.shuffle(cards)
-        return {
+        return FastJSONResponse({
             "total": len(cards),
             "cards": cards
-        }
+        })
 
     # 指定词书的模式
     words = book_manager.load(data.book_id)
@@ -842,11 +966,16 @@ async def api_session_start(
 
     # 过滤单元
     if data.unit:
-        words = [w for w in words if w.unit == data.unit]
+        words = book_manager.get_words_by_unit(data.book_id, data.unit)
 
     # 获取用户进度
-    progress_list = get_user_progress(db, user["id"], data.book_id)
-    progress_map = {p.word: p for p in progress_list}
+    progress_rows = get_user_progress_projection(
+        db, user["id"], data.book_id, Progress.word, Progress.state, Progress.due
+    )
+    progress_map = {p.word: p for p in progress_rows}
+
+    # 复习模式：(due, card) 列表，按 due 排序后再取卡片，不往卡片里塞临时字段
+    review_items = []
 
     # 复习模式时，批量获取历史统计
     history_stats = {}
@@ -871,16 +1000,15 @@ async def api_session_start(
         elif data.mode == "review":
             # 指定词书的复习模式：收集所有已学单词（由下方统一截断）
             if p and p.state >= 1:
-                cards.append({
+                review_items.append((p.due or datetime.min, {
                     "word": word.word,
                     "phonetic": word.phonetic,
                     "translation": word.translation,
                     "unit": word.unit,
                     "book_id": data.book_id,
                     "is_new": False,
-                    "due": p.due,
                     "history_stats": history_stats.get((data.book_id, word.word))
-                })
+                }))
         else:
             # all: 所有词
             is_new = p is None
@@ -898,28 +1026,23 @@ async def api_session_start(
         # 获取用户年级
         db_user = db.query(User).filter(User.id == user["id"]).first()
         user_grade = db_user.grade if db_user else None
-        # 按 due 升序排列（最紧急在前）
-        cards.sort(key=lambda c: c.get("due") or datetime.min)
         # 按年级随机目标（初中50-100，高中70-120），同一天固定
         from datetime import date
         min_t, max_t = get_daily_target_range(user_grade)
         day_seed = hash((date.today().isoformat(), user["id"], data.book_id or ""))
         rng = random.Random(day_seed)
         daily_target = rng.randint(min_t, max_t)
-        target = min(daily_target, len(cards))
-        cards = cards[:target]
-        # 移除临时 due 字段
-        for c in cards:
-            c.pop("due", None)
+        # 只取 due 最早的 daily_target 张（最紧急优先），无需整体排序
+        cards = [card for _, card in heapq.nsmallest(daily_target, review_items, key=itemgetter(0))]
         random.shuffle(cards)
 
     # 限制数量
     cards = cards[:data.limit]
 
-    return {
+    return FastJSONResponse({
         "total": len(cards),
         "cards": cards
-    }
+    })
 
 
 @app.post("/api/session/submit")
@@ -944,7 +1067,7 @@ async def api_session_submit(
     synonym_hint = ""
     if not correct and data.input.strip():
         user_grade = user.get("grade")
-        syn_result = synonym_index.check_synonym(data.word, data.input, grade=user_grade)
+        syn_result = get_synonym_index().check_synonym(data.word, data.input, grade=user_grade)
         if syn_result:
             is_synonym = True
             synonym_hint = syn_result["hint"]
@@ -1040,6 +1163,7 @@ async def api_session_complete(
     # 添加历史记录
     result = "skipped" if data.skipped else ("correct" if data.correct else "wrong")
     add_history(db, user["id"], data.book_id, data.word, data.inputs, result, data.attempts, grade)
+    _invalidate_stats(user["id"])
 
     return {
         "success": True,
@@ -1051,6 +1175,39 @@ async def api_session_complete(
 
 # ==================== TTS API ====================
 
+# 预编译的字符过滤（C 层一次扫描，代替逐字符的生成器表达式）
+_strip_non_letters = re.compile(r"[\W\d_]+").sub               # 只保留字母
+_strip_non_letters_spaces = re.compile(r"[^\w\s]|[\d_]").sub   # 只保留字母和空白
+_strip_unsafe_filename = re.compile(r"[^\w \-]").sub         # 只保留字母数字、空格、-、_
+
+# 同一引擎、同一缓存 key 的音频内容不变，浏览器可长期缓存（需认证，故为 private）
+TTS_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+@app.on_event("startup")
+async def startup_tts_engine():
+    """启动时在线程池中预加载 TTS 引擎（edge_tts 及其依赖导入较慢），首个合成请求不再承担导入开销"""
+    available = await asyncio.to_thread(tts_service.engine.is_available)
+    logger.info("[TTS] 引擎: %s", tts_service.engine.name if available else "不可用")
+
+
+def _tts_etag(cache_key: str) -> str:
+    """根据引擎名 + TTS 缓存 key 生成 ETag"""
+    src = f"{tts_service.get_active_engine_name()}:{cache_key}"
+    return f'"{hashlib.blake2b(src.encode("utf-8"), digest_size=12).hexdigest()}"'
+
+
+def _tts_not_modified(request: Request, etag: str, cache_key: str) -> Optional[Response]:
+    """
+    If-None-Match 命中且服务端缓存文件存在时返回 304 响应，否则返回 None
+
+    缓存文件不存在说明该音频未成功合成过，客户端持有的副本不可信，需重新下发
+    """
+    if request.headers.get("if-none-match") == etag and tts_service.cache.get(cache_key):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": TTS_CACHE_CONTROL})
+    return None
+
+
 # 注意：音节路由必须在通用 TTS 路由之前定义，否则会被 /api/tts/{speed}/{word} 匹配
 
 @app.get("/api/tts/syllables/{word}")
@@ -1078,7 +1235,7 @@ async def api_tts_syllables(
     if len(words) > 1:
         all_syllables = []
         for idx, w in enumerate(words):
-            safe_w = "".join(c for c in w if c.isalpha())
+            safe_w = _strip_non_letters("", w)
             if safe_w:
                 all_syllables.extend(tts_service.split_syllables(safe_w))
                 if idx < len(words) - 1:
@@ -1089,7 +1246,7 @@ async def api_tts_syllables(
             "syllables_display": " · ".join(s if s != " " else " " for s in all_syllables)
         }
 
-    safe_word = "".join(c for c in word if c.isalpha())
+    safe_word = _strip_non_letters("", word)
     if not safe_word:
         return {"error": "无效的单词"}
 
@@ -1105,6 +1262,7 @@ async def api_tts_syllables(
 @app.get("/api/tts/syllables/audio/{word}")
 async def api_tts_syllables_audio(
     word: str,
+    request: Request,
     voice: Optional[str] = None,
     user: dict = Depends(require_auth)
 ):
@@ -1118,41 +1276,87 @@ async def api_tts_syllables_audio(
     Returns:
         音频文件（MP3）
     """
-    safe_word = "".join(c for c in word if c.isalpha())
+    safe_word = _strip_non_letters("", word)
     if not safe_word:
         raise HTTPException(status_code=400, detail="无效的单词")
 
+    cache_key = tts_service.make_syllables_key(safe_word, voice)
+    etag = _tts_etag(cache_key)
+    not_modified = _tts_not_modified(request, etag, cache_key)
+    if not_modified:
+        return not_modified
+
     result = await tts_service.synthesize_syllables(word=safe_word, voice_id=voice)
     if not result:
         raise HTTPException(status_code=500, detail="音频合成失败")
 
-    return FileResponse(str(result), media_type="audio/mpeg", filename=f"{safe_word}_syllables.mp3")
+    return AudioFileResponse(
+        str(result), media_type="audio/mpeg", filename=f"{safe_word}_syllables.mp3",
+        headers={"ETag": etag, "Cache-Control": TTS_CACHE_CONTROL}
+    )
 
 
 @app.get("/api/tts/{speed}/{word}")
-async def api_tts(speed: str, word: str, voice: Optional[str] = None, user: dict = Depends(require_auth)):
+async def api_tts(speed: str, word: str, request: Request, voice: Optional[str] = None,
+                  user: dict = Depends(require_auth)):
     """获取单词发音（需要认证）- 统一 TTS 服务"""
-    safe_word = "".join(c for c in word if c.isalpha() or c.isspace())
+    safe_word = _strip_non_letters_spaces("", word)
     if not safe_word:
         raise HTTPException(status_code=400, detail="无效的单词")
 
-    result = await tts_service.synthesize(text=safe_word, language="en", speed=speed, voice_id=voice)
-    if not result:
+    cache_key = tts_service.make_key(safe_word, "en", speed, voice)
+    etag = _tts_etag(cache_key)
+    not_modified = _tts_not_modified(request, etag, cache_key)
+    if not_modified:
+        return not_modified
+
+    # 单词音频走内存 LRU，重复听写的热门单词不再读盘
+    audio_data = await tts_service.synthesize_bytes(
+        text=safe_word, language="en", speed=speed, voice_id=voice, cache_key=cache_key
+    )
+    if not audio_data:
         raise HTTPException(status_code=503, detail="TTS 服务不可用")
-    return FileResponse(str(result), media_type="audio/mpeg", filename=f"{safe_word}.mp3")
+    return Response(
+        content=audio_data, media_type="audio/mpeg",
+        headers={"ETag": etag, "Cache-Control": TTS_CACHE_CONTROL}
+    )
 
 
 @app.get("/api/tts/sentence")
 async def api_tts_sentence(
     sentence: str,
+    request: Request,
     voice: Optional[str] = None,
     user: dict = Depends(require_auth)
 ):
     """获取句子发音（需要认证）- 统一 TTS 服务"""
-    result = await tts_service.synthesize(text=sentence, language="en", speed="moderate", voice_id=voice)
-    if not result:
+    if not sentence.strip():
         raise HTTPException(status_code=503, detail="TTS 服务不可用")
-    return FileResponse(str(result), media_type="audio/mpeg")
+
+    cache_key = tts_service.make_key(sentence, "en", "moderate", voice)
+    etag = _tts_etag(cache_key)
+    not_modified = _tts_not_modified(request, etag, cache_key)
+    if not_modified:
+        return not_modified
+
+    cached = tts_service.get_cached(
+        text=sentence, language="en", speed="moderate", voice_id=voice, cache_key=cache_key
+    )
+    if cached:
+        return AudioFileResponse(
+            str(cached), media_type="audio/mpeg",
+            headers={"ETag": etag, "Cache-Control": TTS_CACHE_CONTROL}
+        )
+
+    # 未命中缓存：边合成边返回，首块音频到达即可播放（合成完成后自动写入缓存）
+    # 先等到首块音频再返回响应，合成失败或没有音频时仍返回 503
+    chunks = await tts_service.stream(
+        text=sentence, language="en", speed="moderate", voice_id=voice, cache_key=cache_key
+    )
+    if chunks is None:
+        raise HTTPException(status_code=503, detail="TTS 服务不可用")
+    # 流式响应发出时音频尚未合成完整，不能让浏览器长期缓存；完整音频写入缓存后下次走上面的缓存分支
+    return StreamingResponse(chunks, media_type="audio/mpeg", headers={"Cache-Control": "no-store"})
 
 
 @app.get("/api/tts/config")
@@ -1173,17 +1377,164 @@ async def api_tts_voices(user: dict = Depends(require_auth)):
 
 # ==================== 阿里云百炼 Qwen API ====================
 
+QWEN_BASE_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1"
+QWEN_CHAT_URL = f"{QWEN_BASE_URL}/chat/completions"
+
+# API Key 启动时读取一次（.env 已在模块开头加载），请求头预先构建，各请求直接复用
+DASHSCOPE_API_KEY = os.getenv("DASHSCOPE_API_KEY")
+DASHSCOPE_HEADERS = {
+    "Authorization": f"Bearer {DASHSCOPE_API_KEY}",
+    "Content-Type": "application/json"
+} if DASHSCOPE_API_KEY else None
+DASHSCOPE_STREAM_HEADERS = {**DASHSCOPE_HEADERS, "Accept": "text/event-stream"} if DASHSCOPE_HEADERS else None
+
+
+def _get_qwen_client() -> "httpx.AsyncClient":
+    """获取共享的 Qwen HTTP 客户端（连接池复用 TCP/TLS 连接，避免每次请求重新握手）"""
+    client = getattr(app.state, "qwen_client", None)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0)
+        )
+        app.state.qwen_client = client
+    return client
+
+
+async def _prewarm_qwen():
+    """预热 Qwen 连接：提前完成 DNS 解析和 TLS 握手，首个用户请求不再承担冷启动延迟"""
+    try:
+        await _get_qwen_client().get(
+            f"{QWEN_BASE_URL}/models",
+            headers=DASHSCOPE_HEADERS,
+            timeout=5.0
+        )
+        print("[Qwen] 连接预热完成")
+    except Exception as e:
+        print(f"[Qwen] 连接预热失败: {e}")
+
+
+async def _qwen_chat_stream(body: dict, timeout: float) -> Tuple[int, str]:
+    """
+    以流式（SSE）调用 Qwen 对话接口，边接收边拼接增量内容
+
+    长回复不必等整段生成完才开始接收，超时按每次读取计算。
+
+    Returns:
+        (状态码, 内容)：成功时为拼接后的回复文本，失败时为错误响应正文
+    """
+    parts = []
+    async with _get_qwen_client().stream(
+        "POST",
+        QWEN_CHAT_URL,
+        timeout=timeout,
+        headers=DASHSCOPE_STREAM_HEADERS,
+        json={**body, "stream": True}
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
+            return response.status_code, response.text
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            chunk = line[5:].strip()
+            if chunk == "[DONE]":
+                break
+            choices = json_loads(chunk).get("choices")
+            if choices:
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+
+    return 200, "".join(parts)
+
+
+@app.on_event("startup")
+async def startup_qwen_client():
+    """启动时创建 Qwen 连接池并后台预热"""
+    if not QWEN_AVAILABLE:
+        return
+    _get_qwen_client()
+    if DASHSCOPE_HEADERS:
+        # 后台预热，不阻塞启动；保存引用防止任务被回收
+        app.state.qwen_prewarm = asyncio.create_task(_prewarm_qwen())
+
+
+@app.on_event("shutdown")
+async def shutdown_qwen_client():
+    """关闭时释放 Qwen 连接池"""
+    client = getattr(app.state, "qwen_client", None)
+    if client is not None:
+        await client.aclose()
+    await conv_manager.aclose()
+    await close_speech_http_client()
+
+
+# 例句/记忆技巧缓存：同一单词的生成结果基本稳定，跨用户复用 7 天（只缓存成功结果）
+_word_content_cache = TTLCache(maxsize=4096, ttl=7 * 24 * 3600)
+
+
+# 进行中的 Qwen 请求：相同 key 的并发请求等待同一个结果，避免重复调用
+_inflight = {}
+
+# 共享结果不可用（执行者被取消等）时写入 Future 的标记：等待者不随之失败，而是自己重新执行
+_COALESCE_RETRY = object()
+
+
+async def _coalesce(key, factory):
+    """
+    单飞（single-flight）执行：同一 key 同时只有一个 factory() 在运行
+
+    后到的请求直接等待先到请求的结果（包括异常），完成后移除记录。
+    先到的请求被取消（如客户端断开）时，等待者改为自己执行，其中一个成为新的执行者。
+    """
+    while (fut := _inflight.get(key)) is not None:
+        # shield：某个等待者被取消不影响共享的 Future
+        result = await asyncio.shield(fut)
+        if result is not _COALESCE_RETRY:
+            return result
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await factory()
+    except asyncio.CancelledError:
+        fut.set_result(_COALESCE_RETRY)
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # 标记异常已读取，无等待者时不告警
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
 @app.post("/api/example-sentence")
 async def api_example_sentence(data: ExampleRequest, user: dict = Depends(require_auth)):
     """生成例句（使用阿里云百炼 Qwen-Plus）"""
+    cache_key = ("example", data.word, data.translation)
+    cached = _word_content_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    return await _coalesce(cache_key, lambda: _generate_example_sentence(data, cache_key))
+
+
+async def _generate_example_sentence(data: ExampleRequest, cache_key: tuple) -> dict:
+    """调用 Qwen 生成例句，成功结果写入缓存"""
     if not QWEN_AVAILABLE:
         return {"sentence": None, "chinese": None, "error": "Qwen 服务不可用"}
 
-    api_key = os.getenv("DASHSCOPE_API_KEY")
-    if not api_key:
+    if not DASHSCOPE_HEADERS:
         return {"sentence": None, "chinese": None, "error": "未配置 DASHSCOPE_API_KEY"}
 
-    prompt = f"""单词 {data.word}（{data.translation}），生成一个简单例句帮助学生记忆拼写。
+    prompt = f"""你是英语教师助手，辅导中国初中生学习英语词汇。
+单词 {data.word}（{data.translation}），生成一个简单例句帮助学生记忆拼写。
 要求：
 - 句子简短（10词以内）
 - 适合初中生理解
@@ -1192,51 +1543,177 @@ async def api_example_sentence(data: ExampleRequest, user: dict = Depends(requir
 返回JSON：{{"sentence": "例句", "chinese": "中文翻译"}}"""
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.post(
-                "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "qwen-plus",
-                    "messages": [
-                        {"role": "system", "content": "你是一位英语教师助手，辅导中国初中生学习英语词汇。回复使用JSON格式。"},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 200
-                }
-            )
+        client = _get_qwen_client()
+        response = await client.post(
+            QWEN_CHAT_URL,
+            timeout=15.0,
+            headers=DASHSCOPE_HEADERS,
+            json={
+                "model": "qwen-plus",
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.7,
+                "max_tokens": 80,
+                "response_format": {"type": "json_object"}
+            }
+        )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                # 解析 JSON（处理可能的 markdown 代码块）
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-
-                return json.loads(content)
-            else:
-                return {"sentence": None, "chinese": None, "error": f"API 返回 {response.status_code}"}
+        if response.status_code == 200:
+            result = json_loads(response.content)
+            # json_object 模式保证回复是纯 JSON，无需剥离代码块
+            parsed = json_loads(result["choices"][0]["message"]["content"])
+            _word_content_cache[cache_key] = parsed
+            return parsed
+        else:
+            return {"sentence": None, "chinese": None, "error": f"API 返回 {response.status_code}"}
     except Exception as e:
         return {"sentence": None, "chinese": None, "error": str(e)}
 
 
+# 单次批量生成例句的单词上限（控制 prompt/输出长度）
+EXAMPLE_BATCH_MAX = 50
+
+
+@app.post("/api/example-sentences/batch")
+async def api_example_sentences_batch(data: ExampleBatchRequest, user: dict = Depends(require_auth)):
+    """
+    批量生成例句（一次 Qwen 调用生成多个单词的例句）
+
+    用于会话开始时预取新词例句，结果写入例句缓存，
+    之后逐词请求 /api/example-sentence 直接命中缓存；
+    批量生成期间到达的逐词请求通过 _inflight 等待本次批量结果，不再单独调用 Qwen。
+
+    Returns:
+        {"items": [{"word", "sentence", "chinese"}, ...]}，与请求顺序一致，失败的项为 None
+    """
+    if len(data.items) > EXAMPLE_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"单次最多 {EXAMPLE_BATCH_MAX} 个单词")
+
+    results = {}
+    missing = []
+    pending = {}  # 其他请求正在生成的例句：key -> Future
+    for item in data.items:
+        key = ("example", item.word, item.translation)
+        if key in results:
+            continue
+        cached = _word_content_cache.get(key)
+        if cached is not None:
+            results[key] = cached
+            continue
+        results[key] = None
+        fut = _inflight.get(key)
+        if fut is not None:
+            pending[key] = fut
+        else:
+            missing.append(item)
+
+    # 登记本次批量生成的 key：逐词请求到达时等待批量结果；批量未生成的项由等待者自行生成
+    loop = asyncio.get_running_loop()
+    batch_futs = {}
+    for item in missing:
+        key = ("example", item.word, item.translation)
+        batch_futs[key] = _inflight[key] = loop.create_future()
+    try:
+        await _generate_example_batch(missing, results)
+    finally:
+        for key, fut in batch_futs.items():
+            if _inflight.get(key) is fut:
+                del _inflight[key]
+            fut.set_result(results[key] if results[key] is not None else _COALESCE_RETRY)
+
+    for key, fut in pending.items():
+        try:
+            parsed = await asyncio.shield(fut)
+        except Exception:
+            continue
+        if isinstance(parsed, dict) and parsed.get("sentence"):
+            results[key] = parsed
+
+    items = []
+    for item in data.items:
+        parsed = results[("example", item.word, item.translation)]
+        items.append({"word": item.word, **parsed} if parsed else None)
+    return {"items": items}
+
+
+async def _generate_example_batch(missing: list, results: dict) -> None:
+    """一次 Qwen 调用生成多个单词的例句，成功项写入缓存并回填 results"""
+    if not (missing and QWEN_AVAILABLE and DASHSCOPE_HEADERS):
+        return
+
+    word_lines = "\n".join(f"{i + 1}. {item.word}（{item.translation}）" for i, item in enumerate(missing))
+    prompt = f"""你是英语教师助手，辅导中国初中生学习英语词汇。
+为以下每个单词各生成一个简单例句帮助学生记忆拼写。
+要求：
+- 句子简短（10词以内）
+- 适合初中生理解
+- 目标单词在句中清晰可辨
+
+单词：
+{word_lines}
+
+按单词顺序返回JSON：{{"items": [{{"word": "单词", "sentence": "例句", "chinese": "中文翻译"}}, ...]}}"""
+
+    try:
+        client = _get_qwen_client()
+        response = await client.post(
+            QWEN_CHAT_URL,
+            timeout=30.0,
+            headers=DASHSCOPE_HEADERS,
+            json={
+                "model": "qwen-plus",
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.7,
+                "max_tokens": 60 * len(missing) + 20,
+                "response_format": {"type": "json_object"}
+            }
+        )
+
+        if response.status_code == 200:
+            result = await _json_loads_async(response.content)
+            content = result["choices"][0]["message"]["content"]
+            generated = (await _json_loads_async(content)).get("items", [])
+
+            # 按单词回填（LLM 可能漏掉或打乱个别项）
+            by_word = {}
+            for entry in generated:
+                if isinstance(entry, dict) and entry.get("sentence"):
+                    by_word.setdefault(str(entry.get("word", "")).lower(), entry)
+            for item in missing:
+                entry = by_word.get(item.word.lower())
+                if entry:
+                    parsed = {"sentence": entry["sentence"], "chinese": entry.get("chinese", "")}
+                    key = ("example", item.word, item.translation)
+                    _word_content_cache[key] = parsed
+                    results[key] = parsed
+    except Exception as e:
+        print(f"[例句] 批量生成失败: {e}")
+
+
 @app.post("/api/memory-tip")
 async def api_memory_tip(data: MemoryTipRequest, user: dict = Depends(require_auth)):
     """生成记忆技巧（词根拆解、联想、口诀）"""
+    cache_key = ("memory_tip", data.word, data.translation, data.phonetic)
+    cached = _word_content_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    return await _coalesce(cache_key, lambda: _generate_memory_tip(data, cache_key))
+
+
+async def _generate_memory_tip(data: MemoryTipRequest, cache_key: tuple) -> dict:
+    """调用 Qwen 生成记忆技巧，成功结果写入缓存"""
     if not QWEN_AVAILABLE:
         return {"tip": None, "error": "Qwen 服务不可用"}
 
-    api_key = os.getenv("DASHSCOPE_API_KEY")
-    if not api_key:
+    if not DASHSCOPE_HEADERS:
         return {"tip": None, "error": "未配置 DASHSCOPE_API_KEY"}
 
-    prompt = f"""单词: {data.word}
+    prompt = f"""你是英语教师助手，擅长用构词法帮助中国初中生拆解记忆英语单词。
+单词: {data.word}
 音标: {data.phonetic}
 释义: {data.translation}
 
@@ -1258,38 +1735,70 @@ async def api_memory_tip(data: MemoryTipRequest, user: dict = Depends(require_au
 如果单词无法拆解，breakdown 返回空字符串，similar 也返回空数组。"""
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "qwen-plus",
-                    "messages": [
-                        {"role": "system", "content": "你是一位英语教师助手，擅长用构词法帮助中国初中生拆解记忆英语单词。回复使用JSON格式。"},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 250
-                }
-            )
+        client = _get_qwen_client()
+        response = await client.post(
+            QWEN_CHAT_URL,
+            timeout=10.0,
+            headers=DASHSCOPE_HEADERS,
+            json={
+                "model": "qwen-plus",
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.3,
+                "max_tokens": 150,
+                "response_format": {"type": "json_object"}
+            }
+        )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                return json.loads(content)
-            else:
-                return {"tip": None, "error": f"API 返回 {response.status_code}"}
+        if response.status_code == 200:
+            result = json_loads(response.content)
+            content = result["choices"][0]["message"]["content"]
+            # 解析 JSON（处理可能的 markdown 代码块）
+            content = strip_fence(content)
+            parsed = json_loads(content)
+            _word_content_cache[cache_key] = parsed
+            return parsed
+        else:
+            return {"tip": None, "error": f"API 返回 {response.status_code}"}
     except Exception as e:
         return {"tip": None, "error": str(e)}
 
 
+def _iter_shuffled(pool: list):
+    """按随机顺序逐个产出 pool 中的元素（惰性 Fisher-Yates，只为已产出的元素付出开销）"""
+    import random
+
+    n = len(pool)
+    swapped = {}
+    for i in range(n):
+        j = random.randrange(i, n)
+        yield pool[swapped.get(j, j)]
+        swapped[j] = swapped.get(i, i)
+
+
+def _sample_distractors(pool: list, k: int, reject: set) -> List[str]:
+    """
+    从 pool 中随机抽取至多 k 个不在 reject（小写）中的单词
+
+    按随机顺序逐个检查，凑足 k 个或 pool 耗尽为止；pool 中的重复单词和被拒绝的单词
+    都会跳过，不占名额。通常只需检查少量单词，无需打乱整个 pool。
+    抽中的单词会加入 reject，避免重复。
+    """
+    picked = []
+    if k <= 0:
+        return picked
+    for w in _iter_shuffled(pool):
+        key = w.word.lower()
+        if key in reject:
+            continue
+        reject.add(key)
+        picked.append(w.word)
+        if len(picked) >= k:
+            break
+    return picked
+
+
 @app.post("/api/quiz/options")
 async def api_quiz_options(data: QuizOptionsRequest, user: dict = Depends(require_auth)):
     """生成选择题：看中文选英文，返回容易混淆的英文单词作为干扰项"""
@@ -1299,37 +1808,23 @@ async def api_quiz_options(data: QuizOptionsRequest, user: dict = Depends(requir
     if not words:
         raise HTTPException(status_code=404, detail="词书不存在")
 
-    # 找到目标词
-    target_word = None
-    for w in words:
-        if w.word == data.word:
-            target_word = w
-            break
-
+    # 找到目标词（词书索引 O(1) 查找）
+    target_word = book_manager.get_word(data.book_id, data.word)
     if not target_word:
         raise HTTPException(status_code=404, detail="单词不存在")
 
     # 获取目标词的同义词集合（按学生学段过滤），选项中排除同义词避免歧义
     user_grade = user.get("grade")
-    target_synonyms = synonym_index.get_synonyms(data.word, grade=user_grade)
-
-    # 收集干扰英文单词：优先同单元、拼写相近的词，排除同义词
-    same_unit = []
-    other_unit = []
-    for w in words:
-        if w.word == data.word:
-            continue
-        if w.word.lower() in target_synonyms:
-            continue  # 排除同义词，避免选项歧义
-        if data.unit and w.unit == data.unit:
-            same_unit.append(w.word)
-        else:
-            other_unit.append(w.word)
+    target_synonyms = get_synonym_index().get_synonyms(data.word, grade=user_grade)
+    reject = {data.word.lower()} | target_synonyms
 
-    # 优先同单元，不足从其他单元补
-    random.shuffle(same_unit)
-    random.shuffle(other_unit)
-    distractors = (same_unit + other_unit)[:3]
+    # 收集干扰英文单词：优先同单元，不足从整本词书补
+    distractors = []
+    if data.unit:
+        same_unit = book_manager.get_words_by_unit(data.book_id, data.unit)
+        distractors = _sample_distractors(same_unit, 3, reject)
+    if len(distractors) < 3:
+        distractors += _sample_distractors(words, 3 - len(distractors), reject)
 
     # 不足3个时用固定干扰项
     fallback = ["running", "happy", "school", "often"]
@@ -1340,11 +1835,10 @@ async def api_quiz_options(data: QuizOptionsRequest, user: dict = Depends(requir
                 if len(distractors) >= 3:
                     break
 
-    # 组合并打乱
-    options = [data.word] + distractors[:3]
-    correct_idx = 0
-    random.shuffle(options)
-    correct_idx = options.index(data.word)
+    # 干扰项本身已是随机顺序，正确答案插入随机位置即可，无需打乱后再查找
+    options = distractors[:3]
+    correct_idx = random.randint(0, len(options))
+    options.insert(correct_idx, data.word)
 
     return {"options": options, "correct_idx": correct_idx}
 
@@ -1353,7 +1847,7 @@ async def api_quiz_options(data: QuizOptionsRequest, user: dict = Depends(requir
 async def api_get_synonyms(word: str, user: dict = Depends(require_auth)):
     """获取单词的同义词列表（按学生学段过滤）"""
     user_grade = user.get("grade")
-    synonyms = synonym_index.get_synonyms(word, grade=user_grade)
+    synonyms = get_synonym_index().get_synonyms(word, grade=user_grade)
     return {"word": word, "synonyms": sorted(synonyms)[:5]}  # 最多返回5个
 
 
@@ -1361,28 +1855,54 @@ async def api_get_synonyms(word: str, user: dict = Depends(require_auth)):
 
 # 注意：固定路径必须放在动态路径之前，否则 "global" 会被当作 book_id
 
+# 统计结果短时缓存：仪表盘加载时会并发请求多个统计接口，10 秒内的重复访问直接返回
+# key 的第二项固定为 user_id，学习记录写入时按用户失效
+_stats_cache = TTLCache(maxsize=2048, ttl=10)
+
+
+def _cached_stats(key: tuple, compute):
+    """读取统计缓存，未命中时调用 compute() 计算并缓存"""
+    result = _stats_cache.get(key)
+    if result is None:
+        result = compute()
+        _stats_cache[key] = result
+    return result
+
+
+def _invalidate_stats(user_id: int):
+    """清除某用户的统计缓存（学习进度/会话写入后调用）"""
+    for key in [k for k in _stats_cache.keys() if k[1] == user_id]:
+        _stats_cache.pop(key, None)
+
+
 @app.get("/api/stats/global")
 async def api_global_stats(user: dict = Depends(require_auth), db: Session = Depends(get_db)):
     """获取全局学习统计（跨所有词书）"""
-    stats = get_user_stats(db, user["id"])  # 不传 book_id
+    cache_key = ("global", user["id"])
+    cached = _stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    from database import User, get_global_mastered_curve
 
     # 获取用户年级并过滤词书
-    from database import User
     db_user = db.query(User).filter(User.id == user["id"]).first()
     user_grade = db_user.grade if db_user else None
+
+    # 三个统计查询互不依赖，在线程池中并发执行（各用独立会话）
+    stats, (due_cards, daily_target), curve_data = await asyncio.gather(
+        run_in_threadpool(run_with_session, get_user_stats, user["id"]),  # 不传 book_id
+        run_in_threadpool(run_with_session, get_due_cards, user["id"], user_grade=user_grade),
+        run_in_threadpool(run_with_session, get_global_mastered_curve, user["id"], days=1),
+    )
+
     book_ids = book_manager.list_books()
     filtered_book_ids = filter_books_by_grade(book_ids, user_grade)
 
-    # 计算过滤后词书的总词数
-    total_words = 0
-    for book_id in filtered_book_ids:
-        words = book_manager.load(book_id)
-        if words:
-            total_words += len(words)
-    stats["total_words"] = total_words
+    # 计算过滤后词书的总词数（词书已缓存在内存，无需逐本解析文件）
+    stats["total_words"] = sum(book_manager.count_words(b) for b in filtered_book_ids)
 
     # 获取全局待复习数（按年级目标 + 高中生新词）
-    due_cards, daily_target = get_due_cards(db, user["id"], user_grade=user_grade)
     due_cards = [p for p in due_cards if book_manager.get_word(p.book_id, p.word)]
     due_count = len(due_cards)
     # 高中生额外加 10-20 新词的估算中间值
@@ -1391,10 +1911,9 @@ async def api_global_stats(user: dict = Depends(require_auth), db: Session = Dep
     stats["due_today"] = due_count
 
     # 获取当前掌握数（从曲线数据获取）
-    from database import get_global_mastered_curve
-    curve_data = get_global_mastered_curve(db, user["id"], days=1)
     stats["mastered"] = curve_data.get("total", 0)
 
+    _stats_cache[cache_key] = stats
     return stats
 
 
@@ -1413,7 +1932,8 @@ async def api_mastered_curve(
         {"dates": ["01-20", ...], "counts": [10, ...], "total": 当前总掌握数}
     """
     from database import get_global_mastered_curve
-    return get_global_mastered_curve(db, user["id"], days)
+    return _cached_stats(("mastered_curve", user["id"], days),
+                         lambda: get_global_mastered_curve(db, user["id"], days))
 
 
 @app.post("/api/session/save")
@@ -1443,6 +1963,7 @@ async def api_session_save(
         skipped_count=data.skipped_count,
         best_streak=data.best_streak
     )
+    _invalidate_stats(user["id"])
     return {"success": True, "session_id": record.id}
 
 
@@ -1454,7 +1975,8 @@ async def api_learning_stats(
 ):
     """获取学习统计（含时长、正确率分布、词书分布）"""
     from database import get_learning_stats
-    return get_learning_stats(db, user["id"], period)
+    return _cached_stats(("learning", user["id"], period),
+                         lambda: get_learning_stats(db, user["id"], period))
 
 
 @app.get("/api/stats/weak-words")
@@ -1465,7 +1987,8 @@ async def api_weak_words(
 ):
     """获取薄弱单词列表"""
     from database import get_weak_words
-    return {"words": get_weak_words(db, user["id"], limit)}
+    return _cached_stats(("weak_words", user["id"], limit),
+                         lambda: {"words": get_weak_words(db, user["id"], limit)})
 
 
 @app.get("/api/stats/streak")
@@ -1475,7 +1998,7 @@ async def api_streak(
 ):
     """获取连续学习天数"""
     from database import get_learning_streak
-    return get_learning_streak(db, user["id"])
+    return _cached_stats(("streak", user["id"]), lambda: get_learning_streak(db, user["id"]))
 
 
 @app.get("/api/stats/review-completion")
@@ -1485,7 +2008,7 @@ async def api_review_completion(
 ):
     """获取今日复习完成率"""
     from database import get_review_completion
-    return get_review_completion(db, user["id"])
+    return _cached_stats(("review_completion", user["id"]), lambda: get_review_completion(db, user["id"]))
 
 
 @app.get("/api/stats/pronunciation")
@@ -1513,17 +2036,21 @@ async def api_phoneme_errors(
 @app.get("/api/stats/{book_id}")
 async def api_stats(book_id: str, user: dict = Depends(require_auth), db: Session = Depends(get_db)):
     """获取学习统计（指定词书）"""
-    stats = get_user_stats(db, user["id"], book_id)
+    return _cached_stats(("book", user["id"], book_id), lambda: _compute_book_stats(db, user["id"], book_id))
+
+
+def _compute_book_stats(db: Session, user_id: int, book_id: str) -> dict:
+    """计算指定词书的学习统计"""
+    stats = get_user_stats(db, user_id, book_id)
 
     # 获取词书总词数
-    words = book_manager.load(book_id)
-    stats["total_words"] = len(words) if words else 0
+    stats["total_words"] = book_manager.count_words(book_id)
 
     # 获取今日待复习数（该词书，按年级目标）
     from database import User as UserModel
-    db_user = db.query(UserModel).filter(UserModel.id == user["id"]).first()
+    db_user = db.query(UserModel).filter(UserModel.id == user_id).first()
     user_grade = db_user.grade if db_user else None
-    due_cards, _ = get_due_cards(db, user["id"], book_id, user_grade=user_grade)
+    due_cards, _ = get_due_cards(db, user_id, book_id, user_grade=user_grade)
     due_cards = [p for p in due_cards if book_manager.get_word(p.book_id, p.word)]
     stats["due_today"] = len(due_cards)
 
@@ -1532,6 +2059,76 @@ async def api_stats(book_id: str, user: dict = Depends(require_auth), db: Sessio
 
 # ==================== 语音识别 API ====================
 
+# 允许的录音扩展名（与前端 recorder 可能产生的格式一致），其他一律按 webm 处理
+_DEFAULT_AUDIO_EXT = ".webm"
+_AUDIO_EXTS = {".webm", ".wav", ".mp3", ".m4a", ".mp4", ".ogg"}
+
+
+def _ext_of(filename: Optional[str]) -> str:
+    """从上传文件名取音频扩展名（白名单校验，防止任意扩展名流入文件路径）"""
+    if not filename:
+        return _DEFAULT_AUDIO_EXT
+    i = filename.rfind(".")
+    ext = filename[i:].lower() if i >= 0 else ""
+    return ext if ext in _AUDIO_EXTS else _DEFAULT_AUDIO_EXT
+
+
+# 上传音频超过该大小时先分块落盘，再按路径交给识别/评估，避免整段读入内存
+UPLOAD_SPOOL_THRESHOLD = 256 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _spool_upload(src: BinaryIO, ext: str) -> str:
+    """将上传文件分块复制到命名临时文件（同步文件操作，在线程池中执行），返回路径"""
+    src.seek(0)
+    with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as f:
+        try:
+            shutil.copyfileobj(src, f, UPLOAD_CHUNK_SIZE)
+        except BaseException:
+            # 写入失败（如磁盘已满）时不留下半截文件
+            f.close()
+            os.unlink(f.name)
+            raise
+        return f.name
+
+
+def _is_small_upload(audio: UploadFile) -> bool:
+    """小文件仍走内存路径（大小未知时按大文件处理）"""
+    return audio.size is not None and audio.size < UPLOAD_SPOOL_THRESHOLD
+
+
+async def _recognize_chinese_upload(audio: UploadFile, ext: str) -> dict:
+    """中文识别上传音频：小文件读入内存，大文件落盘后按路径识别"""
+    if _is_small_upload(audio):
+        return await chinese_recognizer.recognize_from_bytes(await audio.read(), ext)
+
+    try:
+        path = await run_in_threadpool(_spool_upload, audio.file, ext)
+    except OSError as e:
+        logger.error("上传音频落盘失败: %s", e)
+        return {"success": False, "text": "", "error": str(e)}
+    try:
+        return await chinese_recognizer.recognize_from_file(path, ext)
+    finally:
+        os.unlink(path)
+
+
+async def _assess_upload(audio: UploadFile, reference_text: str, ext: str) -> dict:
+    """发音评估上传音频：小文件读入内存，大文件落盘后按路径评估"""
+    if _is_small_upload(audio):
+        return await pronunciation_assessor.assess_from_bytes(await audio.read(), reference_text, ext)
+
+    try:
+        path = await run_in_threadpool(_spool_upload, audio.file, ext)
+    except OSError as e:
+        logger.error("上传音频落盘失败: %s", e)
+        return {"success": False, "error": str(e)}
+    try:
+        return await pronunciation_assessor.assess_from_file(path, reference_text, ext)
+    finally:
+        os.unlink(path)
+
+
 @app.post("/api/speech/recognize")
 async def api_speech_recognize(
     audio: UploadFile = File(...),
@@ -1549,8 +2146,7 @@ async def api_speech_recognize(
     audio_data = await audio.read()
 
     # 获取文件扩展名
-    filename = audio.filename or "recording.webm"
-    ext = "." + filename.rsplit(".", 1)[-1] if "." in filename else ".webm"
+    ext = _ext_of(audio.filename)
 
     # 调用识别
     result = await speech_recognizer.recognize_from_bytes(audio_data, ext)
@@ -1587,8 +2183,7 @@ async def api_speech_recognize_english(
     audio_data = await audio.read()
 
     # 获取文件扩展名
-    filename = audio.filename or "recording.webm"
-    ext = "." + filename.rsplit(".", 1)[-1] if "." in filename else ".webm"
+    ext = _ext_of(audio.filename)
 
     # 调用识别
     result = await english_recognizer.recognize_from_bytes(audio_data, ext, target_word)
@@ -1639,37 +2234,46 @@ async def api_conversation_summary(
 
 # ==================== 发音评估 API ====================
 
+def _store_recording(user_dir: str, safe_word: str, filename: str, src: BinaryIO):
+    """清理旧录音并写入新录音（同步文件操作，在线程池中执行）"""
+    os.makedirs(user_dir, exist_ok=True)
+
+    # 清理旧文件（保留最近2个）
+    # 文件名带 YYYYMMDD_HHMMSS 时间戳，按名称排序即按时间排序，无需逐个 stat
+    prefix = safe_word + "_"
+    with os.scandir(user_dir) as it:
+        existing = sorted(entry.path for entry in it if entry.name.startswith(prefix))
+    for old_file in existing[:-2]:  # 保留最近2个，新的是第3个
+        try:
+            os.unlink(old_file)
+        except:
+            pass
+
+    # 从上传文件分块复制，不再整体读入内存
+    src.seek(0)
+    with open(os.path.join(user_dir, filename), "wb") as f:
+        shutil.copyfileobj(src, f)
+
+
 async def save_pronunciation_audio(user_id: int, book_id: str, word: str,
-                                    audio_data: bytes, ext: str) -> Optional[str]:
+                                    src: BinaryIO, ext: str) -> Optional[str]:
     """
     保存用户跟读音频
 
     存储策略：
     - 路径格式: /static/recordings/{user_id}/{book_id}/{word}_{timestamp}{ext}
     - 只保留最近3次录音（自动清理旧文件）
+    - src 为上传文件对象（UploadFile.file），在线程池中分块写入，不阻塞事件循环
     """
-    # 创建目录
-    user_dir = RECORDINGS_DIR / str(user_id) / book_id
-    user_dir.mkdir(parents=True, exist_ok=True)
+    user_dir = os.path.join(_RECORDINGS_DIR_STR, str(user_id), book_id)
 
     # 清理文件名中的特殊字符
-    safe_word = "".join(c for c in word if c.isalnum() or c in " -_")
+    safe_word = _strip_unsafe_filename("", word)
 
-    # 清理旧文件（保留最近2个）
-    existing = sorted(user_dir.glob(f"{safe_word}_*"), key=lambda x: x.stat().st_mtime)
-    for old_file in existing[:-2]:  # 保留最近2个，新的是第3个
-        try:
-            old_file.unlink()
-        except:
-            pass
-
-    # 保存新文件
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     filename = f"{safe_word}_{timestamp}{ext}"
-    filepath = user_dir / filename
 
-    with open(filepath, "wb") as f:
-        f.write(audio_data)
+    await run_in_threadpool(_store_recording, user_dir, safe_word, filename, src)
 
     # 返回相对路径
     return f"recordings/{user_id}/{book_id}/{filename}"
@@ -1677,14 +2281,28 @@ async def save_pronunciation_audio(user_id: int, book_id: str, word: str,
 
 # ==================== 翻译练习 API ====================
 
+# 相似度计算是纯 CPU 工作：单词级文本微秒级直接计算；超长文本（如异常的长识别结果）
+# 交给线程池，并用 CPU 核数限制并发，突发请求时不阻塞事件循环
+SIMILARITY_OFFLOAD_THRESHOLD = 2000
+_similarity_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+
+async def _text_similarity(reference: str, user_text: str) -> float:
+    """计算译文相似度，长文本在线程池中执行"""
+    if len(reference) + len(user_text) > SIMILARITY_OFFLOAD_THRESHOLD:
+        return await anyio.to_thread.run_sync(
+            calculate_text_similarity, reference, user_text, limiter=_similarity_limiter
+        )
+    return calculate_text_similarity(reference, user_text)
+
+
 @app.post("/api/translation/assess")
 async def api_translation_assess(
     audio: UploadFile = File(...),
     word: str = Form(...),           # 英文单词
     chinese: str = Form(...),        # 标准中文翻译
     book_id: str = Form(...),
-    user: dict = Depends(require_auth),
-    db: Session = Depends(get_db)
+    user: dict = Depends(require_auth)
 ):
     """
     中文翻译练习评估 API
@@ -1717,18 +2335,14 @@ async def api_translation_assess(
             "error": "中文语音识别服务未配置，请检查 DASHSCOPE_API_KEY"
         }
 
-    # 读取音频数据
-    audio_data = await audio.read()
-
     # 获取文件扩展名
-    filename = audio.filename or "recording.webm"
-    ext = "." + filename.rsplit(".", 1)[-1] if "." in filename else ".webm"
+    ext = _ext_of(audio.filename)
 
-    print(f"[翻译评估] 单词: {word}, 标准翻译: {chinese}, 音频大小: {len(audio_data)} bytes")
+    logger.debug("[翻译评估] 单词: %s, 标准翻译: %s, 音频大小: %s bytes", word, chinese, audio.size)
 
     # 1. 中文语音识别
-    asr_result = await chinese_recognizer.recognize_from_bytes(audio_data, ext)
-    print(f"[翻译评估] ASR 结果: {asr_result}")
+    asr_result = await _recognize_chinese_upload(audio, ext)
+    logger.debug("[翻译评估] ASR 结果: %s", asr_result)
 
     if not asr_result.get("success"):
         return {
@@ -1743,11 +2357,11 @@ async def api_translation_assess(
         }
 
     user_chinese = asr_result["text"]
-    print(f"[翻译评估] 识别结果: {user_chinese}")
+    logger.debug("[翻译评估] 识别结果: %s", user_chinese)
 
-    # 2. 计算文本相似度
-    similarity = calculate_text_similarity(chinese, user_chinese)
-    print(f"[翻译评估] 相似度: {similarity:.2f}")
+    # 2. 计算文本相似度（字符集合比较，微秒级；结果同时供降级评价复用）
+    similarity = await _text_similarity(chinese, user_chinese)
+    logger.debug("[翻译评估] 相似度: %.2f", similarity)
 
     # 3. AI 评价翻译
     feedback_result = await generate_translation_feedback(
@@ -1782,8 +2396,7 @@ async def api_translation_passage(
     audio: UploadFile = File(...),
     passage: str = Form(...),        # 英文短文
     book_id: str = Form(...),
-    user: dict = Depends(require_auth),
-    db: Session = Depends(get_db)
+    user: dict = Depends(require_auth)
 ):
     """
     短文翻译评估 API
@@ -1814,18 +2427,14 @@ async def api_translation_passage(
             "error": "中文语音识别服务未配置，请检查 DASHSCOPE_API_KEY"
         }
 
-    # 读取音频数据
-    audio_data = await audio.read()
-
     # 获取文件扩展名
-    filename = audio.filename or "recording.webm"
-    ext = "." + filename.rsplit(".", 1)[-1] if "." in filename else ".webm"
+    ext = _ext_of(audio.filename)
 
-    print(f"[短文翻译] 短文长度: {len(passage)} 字符, 音频大小: {len(audio_data)} bytes")
+    logger.debug("[短文翻译] 短文长度: %d 字符, 音频大小: %s bytes", len(passage), audio.size)
 
     # 1. 中文语音识别
-    asr_result = await chinese_recognizer.recognize_from_bytes(audio_data, ext)
-    print(f"[短文翻译] ASR 结果: {asr_result}")
+    asr_result = await _recognize_chinese_upload(audio, ext)
+    logger.debug("[短文翻译] ASR 结果: %s", asr_result)
 
     if not asr_result.get("success"):
         return {
@@ -1841,10 +2450,9 @@ async def api_translation_passage(
         }
 
     user_chinese = asr_result["text"]
-    print(f"[短文翻译] 识别结果: {user_chinese}")
+    logger.debug("[短文翻译] 识别结果: %s", user_chinese)
 
     # 2. AI 评估短文翻译
-    from speech import evaluate_passage_translation
     eval_result = await evaluate_passage_translation(
         english_passage=passage,
         user_translation=user_chinese
@@ -1862,53 +2470,53 @@ async def api_translation_passage(
     }
 
 
+def _save_pronunciation_result(db: Session, user_id: int, book_id: str, word: str,
+                               audio_path: Optional[str], result: dict):
+    """保存发音评估记录并更新音素错误统计"""
+    phoneme_details = result.get("phoneme_details", [])
+    add_pronunciation_record(
+        db, user_id, book_id, word,
+        audio_path,
+        result.get("accuracy_score"),
+        result.get("pronunciation_score"),
+        result.get("fluency_score"),
+        result.get("completeness_score"),
+        result.get("recognized_text"),
+        json_dumps(phoneme_details),
+        commit=False
+    )
+    # 与上面的记录一起提交
+    update_phoneme_errors(db, user_id, phoneme_details)
+
+
 @app.post("/api/pronunciation/assess")
 async def api_pronunciation_assess(
     audio: UploadFile = File(...),
     word: str = Form(...),
     book_id: str = Form(...),
-    user: dict = Depends(require_auth),
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks = None,
+    user: dict = Depends(require_auth)
 ):
     """
     发音评估 API
 
     接收音频文件和参考单词，返回发音评估结果和反馈
+    评估记录和音素错误统计在响应返回后由后台任务写入
     """
     if not pronunciation_assessor.is_available():
         return {"success": False, "error": "Azure Speech 服务未配置"}
 
-    # 读取音频数据
-    audio_data = await audio.read()
-
     # 获取文件扩展名
-    filename = audio.filename or "recording.webm"
-    ext = "." + filename.rsplit(".", 1)[-1] if "." in filename else ".webm"
+    ext = _ext_of(audio.filename)
 
     # 执行发音评估
-    result = await pronunciation_assessor.assess_from_bytes(audio_data, word, ext)
+    result = await _assess_upload(audio, word, ext)
 
     if result.get("success"):
-        # 保存音频文件
-        audio_path = await save_pronunciation_audio(
-            user["id"], book_id, word, audio_data, ext
-        )
-
-        # 保存评估记录到数据库
-        phoneme_details_json = json.dumps(result.get("phoneme_details", []), ensure_ascii=False)
-        record = add_pronunciation_record(
-            db, user["id"], book_id, word,
-            audio_path,
-            result.get("accuracy_score"),
-            result.get("pronunciation_score"),
-            result.get("fluency_score"),
-            result.get("completeness_score"),
-            result.get("recognized_text"),
-            phoneme_details_json
-        )
-
-        # 更新音素错误统计
-        update_phoneme_errors(db, user["id"], result.get("phoneme_details", []))
+        # 保存音频文件（直接从上传的临时文件复制），与下面的反馈生成（可能调用 LLM）并行
+        save_task = asyncio.create_task(save_pronunciation_audio(
+            user["id"], book_id, word, audio.file, ext
+        ))
 
         # 生成字母到音素的映射（带准确度）
         letter_mapping = merge_assessment_with_letters(word, result.get("phoneme_details", []))
@@ -1937,7 +2545,13 @@ async def api_pronunciation_assess(
             result["practice_words"] = []
             result["focus_phoneme"] = ""
 
-        result["record_id"] = record.id
+        audio_path = await save_task
+
+        # 评估记录和音素错误统计不影响本次响应，放到后台写入（后台任务需独立会话）
+        background_tasks.add_task(
+            run_with_session, _save_pronunciation_result,
+            user["id"], book_id, word, audio_path, result
+        )
 
     return result
 
@@ -1945,10 +2559,11 @@ async def api_pronunciation_assess(
 @app.get("/api/pronunciation/feedback-audio")
 async def api_pronunciation_feedback_audio(text: str):
     """生成中文反馈语音 - 统一 TTS 服务"""
-    result = await tts_service.synthesize(text=text, language="zh", speed="normal")
-    if not result:
+    # 反馈短语（如"发音正确"）高度重复，走内存 LRU，不再 stat/打开文件
+    audio_data = await tts_service.synthesize_bytes(text=text, language="zh", speed="normal")
+    if not audio_data:
         raise HTTPException(status_code=503, detail="TTS 服务不可用")
-    return FileResponse(str(result), media_type="audio/mpeg")
+    return Response(content=audio_data, media_type="audio/mpeg")
 
 
 @app.get("/api/pronunciation/stats")
@@ -1969,7 +2584,7 @@ async def api_pronunciation_stats(
                 "error_rate": round(p.error_count / p.total_attempts * 100, 1) if p.total_attempts > 0 else 0,
                 "avg_accuracy": round(p.avg_accuracy, 1),
                 "total_attempts": p.total_attempts,
-                "error_types": json.loads(p.error_types or "{}")
+                "error_types": json_loads(p.error_types or "{}")
             }
             for p in weak_phonemes
         ]
@@ -2009,6 +2624,45 @@ async def api_pronunciation_records(
 
 # ==================== 跟读练习 API ====================
 
+# 跟读短文生成提示词：固定部分预先拼好，请求时只拼接单词列表
+_READING_PROMPT_HEAD = """你是一位资深英语教师和故事创作者。请根据以下单词，创作一个有趣的英语小故事（3-5句话）。
+
+【必须使用的单词】
+"""
+
+_READING_PROMPT_RULES = """
+
+【创作原则】
+1. **先构思故事，再融入单词**：先想一个有趣的小场景（比如：周末郊游、课堂趣事、生日派对、宠物日常），然后把单词自然地编织进去
+2. **因果关系**：句子之间要有"因为...所以..."、"首先...然后...最后..."这样的逻辑链条
+3. **具体细节**：加入人名、地点、时间等具体细节，让故事更生动
+4. **情感起伏**：故事最好有一点小转折或情感变化（惊喜、感动、好笑等）
+
+【禁止事项】
+❌ 禁止写成"定义句"：如 "A wife is a married woman." "Theirs means belonging to them."
+❌ 禁止写成"孤立句"：如 "I have a son. The book is hers. We are the only students."（句子之间毫无关联）
+❌ 禁止生硬过渡：如 "Speaking of...", "By the way...", "Also..."
+"""
+
+_READING_PROMPT_EXAMPLE = """
+【优秀示例】
+单词：son, wife, only, theirs, hers
+✅ 好："Last Sunday, my son lost his favorite toy car at the park. My wife helped him look everywhere, but we only found a pink doll. 'That's not ours—it must be hers!' my son said, pointing at a little girl nearby. We returned the doll, and the girl's parents gave us a big smile. The toy car? It was in my son's pocket the whole time!"
+
+❌ 差："My son is young. My wife is kind. This is the only book. The car is theirs. The bag is hers."
+"""
+
+_READING_PROMPT_FORMAT = """
+返回 JSON（只返回JSON，不要解释）：
+{"passage": "完整短文", "sentences": ["句子1", "句子2", ...], "words_used": ["已使用的单词列表"]}"""
+
+_READING_PROMPT_TAIL = _READING_PROMPT_RULES + _READING_PROMPT_EXAMPLE + _READING_PROMPT_FORMAT
+
+# 单词很少时省略示例段（约占提示词一半），减少 LLM 输入 token 和预填充耗时
+READING_PROMPT_SHORT_MAX_WORDS = 3
+_READING_PROMPT_TAIL_SHORT = _READING_PROMPT_RULES + _READING_PROMPT_FORMAT
+
+
 @app.post("/api/reading/generate")
 async def api_reading_generate(
     book_id: str,
@@ -2021,12 +2675,21 @@ async def api_reading_generate(
     生成跟读短文
 
     使用词书中的单词，由 LLM 生成一段简短的英语短文
+    同一用户重复提交的相同请求（如连点）合并为一次生成
     """
+    return await _coalesce(
+        ("reading", user["id"], book_id, unit, word_count),
+        lambda: _generate_reading_passage(book_id, unit, word_count, user, db)
+    )
+
+
+async def _generate_reading_passage(book_id: str, unit: Optional[str], word_count: int,
+                                    user: dict, db: Session) -> dict:
+    """选词并调用 Qwen 生成跟读短文"""
     if not QWEN_AVAILABLE:
         raise HTTPException(status_code=503, detail="Qwen 服务不可用")
 
-    api_key = os.getenv("DASHSCOPE_API_KEY")
-    if not api_key:
+    if not DASHSCOPE_HEADERS:
         raise HTTPException(status_code=503, detail="未配置 DASHSCOPE_API_KEY")
 
     # 加载词书
@@ -2036,20 +2699,24 @@ async def api_reading_generate(
 
     # 过滤单元
     if unit:
-        words = [w for w in words if w.unit == unit]
+        words = book_manager.get_words_by_unit(book_id, unit)
 
     if not words:
         raise HTTPException(status_code=404, detail="该单元没有单词")
 
     # 获取用户已学单词
-    progress_list = get_user_progress(db, user["id"], book_id)
-    learned_words = {p.word for p in progress_list}
+    learned_words = get_learned_word_set(db, user["id"], book_id)
 
-    # 优先选择已学单词
-    available_words = [w for w in words if w.word in learned_words]
+    # 优先选择已学单词；一次遍历分组，未学单词最多只需保留前 word_count 个用于补充
+    available_words = []
+    remaining = []
+    for w in words:
+        if w.word in learned_words:
+            available_words.append(w)
+        elif len(remaining) < word_count:
+            remaining.append(w)
     if len(available_words) < word_count:
         # 补充未学单词
-        remaining = [w for w in words if w.word not in learned_words]
         available_words.extend(remaining[:word_count - len(available_words)])
 
     # 随机选择
@@ -2060,73 +2727,44 @@ async def api_reading_generate(
     # 调用阿里云百炼 Qwen-Plus 生成短文
 
     # 获取单词的中文释义，帮助 LLM 理解语境
-    word_meanings = []
-    for w in selected:
-        word_meanings.append(f"{w.word}（{w.translation}）")
-
-    prompt = f"""你是一位资深英语教师和故事创作者。请根据以下单词，创作一个有趣的英语小故事（3-5句话）。
-
-【必须使用的单词】
-{chr(10).join(word_meanings)}
+    word_meanings = [f"{w.word}（{w.translation}）" for w in selected]
 
-【创作原则】
-1. **先构思故事，再融入单词**：先想一个有趣的小场景（比如：周末郊游、课堂趣事、生日派对、宠物日常），然后把单词自然地编织进去
-2. **因果关系**：句子之间要有"因为...所以..."、"首先...然后...最后..."这样的逻辑链条
-3. **具体细节**：加入人名、地点、时间等具体细节，让故事更生动
-4. **情感起伏**：故事最好有一点小转折或情感变化（惊喜、感动、好笑等）
-
-【禁止事项】
-❌ 禁止写成"定义句"：如 "A wife is a married woman." "Theirs means belonging to them."
-❌ 禁止写成"孤立句"：如 "I have a son. The book is hers. We are the only students."（句子之间毫无关联）
-❌ 禁止生硬过渡：如 "Speaking of...", "By the way...", "Also..."
-
-【优秀示例】
-单词：son, wife, only, theirs, hers
-✅ 好："Last Sunday, my son lost his favorite toy car at the park. My wife helped him look everywhere, but we only found a pink doll. 'That's not ours—it must be hers!' my son said, pointing at a little girl nearby. We returned the doll, and the girl's parents gave us a big smile. The toy car? It was in my son's pocket the whole time!"
-
-❌ 差："My son is young. My wife is kind. This is the only book. The car is theirs. The bag is hers."
-
-返回 JSON（只返回JSON，不要解释）：
-{{"passage": "完整短文", "sentences": ["句子1", "句子2", ...], "words_used": ["已使用的单词列表"]}}"""
+    tail = _READING_PROMPT_TAIL_SHORT if len(selected) <= READING_PROMPT_SHORT_MAX_WORDS else _READING_PROMPT_TAIL
+    prompt = _READING_PROMPT_HEAD + "\n".join(word_meanings) + tail
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "qwen-plus",
-                    "messages": [
-                        {"role": "system", "content": "你是一位英语教师助手。回复使用JSON格式。"},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.8,
-                    "max_tokens": 500
-                }
-            )
+        client = _get_qwen_client()
+        response = await client.post(
+            QWEN_CHAT_URL,
+            timeout=30.0,
+            headers=DASHSCOPE_HEADERS,
+            json={
+                "model": "qwen-plus",
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.8,
+                "max_tokens": 400,
+                "response_format": {"type": "json_object"}
+            }
+        )
 
-            if response.status_code != 200:
-                raise HTTPException(status_code=500, detail=f"API 返回 {response.status_code}")
+        if response.status_code != 200:
+            raise HTTPException(status_code=500, detail=f"API 返回 {response.status_code}")
 
-            result = response.json()
-            content = result["choices"][0]["message"]["content"]
+        result = await _json_loads_async(response.content)
+        content = result["choices"][0]["message"]["content"]
 
-            # 解析 JSON（处理可能的 markdown 代码块）
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
+        # 解析 JSON（处理可能的 markdown 代码块）
+        content = strip_fence(content)
 
-            data = json.loads(content)
+        data = await _json_loads_async(content)
 
-            return {
-                "passage": data.get("passage", ""),
-                "sentences": data.get("sentences", []),
-                "words_used": data.get("words_used", word_list)
-            }
+        return {
+            "passage": data.get("passage", ""),
+            "sentences": data.get("sentences", []),
+            "words_used": data.get("words_used", word_list)
+        }
 
     except json.JSONDecodeError:
         raise HTTPException(status_code=500, detail="LLM 返回格式错误")
@@ -2134,6 +2772,30 @@ async def api_reading_generate(
         raise HTTPException(status_code=500, detail=f"生成短文失败: {str(e)}")
 
 
+def _partition_word_scores(word_scores: list) -> Tuple[list, list, list]:
+    """
+    按错误类型和准确度将句子评估的单词分组
+
+    缺少 error_type 的单词按无错误（"None"）处理，只按准确度归类。
+
+    Returns:
+        (problem_words, omitted_words, mispronounced_words)
+    """
+    # 先一次性取出 (单词, 准确度, 错误类型)，再按类别分组
+    items = [(ws.get("word", ""), ws.get("accuracy", 0), ws.get("error_type", "None"))
+             for ws in word_scores]
+
+    # 漏读 (Omission)
+    omitted_words = [w for w, _, e in items if e == "Omission"]
+    # 读错的单词
+    mispronounced_words = [{"word": w, "accuracy": int(a)} for w, a, e in items
+                           if e != "Omission" and (e == "Mispronunciation" or a < 60)]
+    # 其他低分单词
+    problem_words = [{"word": w, "accuracy": int(a)} for w, a, e in items
+                     if e not in ("Omission", "Mispronunciation") and 60 <= a < 80]
+    return problem_words, omitted_words, mispronounced_words
+
+
 @app.post("/api/reading/assess-sentence")
 async def api_reading_assess_sentence(
     audio: UploadFile = File(...),
@@ -2149,45 +2811,27 @@ async def api_reading_assess_sentence(
     if not pronunciation_assessor.is_available():
         raise HTTPException(status_code=503, detail="Azure Speech 服务未配置")
 
-    # 读取音频数据
-    audio_data = await audio.read()
-    print(f"[DEBUG] 收到音频数据: {len(audio_data)} bytes")
-    print(f"[DEBUG] 参考文本: {sentence[:100]}...")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("收到音频数据: %s bytes, 参考文本: %s", audio.size, sentence[:100])
 
     # 获取文件扩展名
-    filename = audio.filename or "recording.webm"
-    ext = "." + filename.rsplit(".", 1)[-1] if "." in filename else ".webm"
+    ext = _ext_of(audio.filename)
 
     # 执行发音评估（使用句子作为参考文本）
-    result = await pronunciation_assessor.assess_from_bytes(audio_data, sentence, ext)
+    result = await _assess_upload(audio, sentence, ext)
 
-    # 打印 Azure 返回的原始结果
-    print(f"[DEBUG] Azure 评估结果: success={result.get('success')}")
-    print(f"[DEBUG] accuracy_score={result.get('accuracy_score')}, fluency_score={result.get('fluency_score')}")
-    print(f"[DEBUG] recognized_text={result.get('recognized_text', '')[:100]}")
-    print(f"[DEBUG] word_scores count={len(result.get('word_scores', []))}")
-    if result.get('error'):
-        print(f"[DEBUG] error={result.get('error')}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "评估结果: success=%s accuracy=%s fluency=%s recognized=%s word_scores=%d error=%s",
+            result.get("success"), result.get("accuracy_score"), result.get("fluency_score"),
+            result.get("recognized_text", "")[:100], len(result.get("word_scores", [])), result.get("error")
+        )
 
     if result.get("success"):
         # 从 word_scores 提取问题单词
         word_scores = result.get("word_scores", [])
-        problem_words = []
-        omitted_words = []  # 漏读的单词
-        mispronounced_words = []  # 读错的单词
-
-        for ws in word_scores:
-            word = ws.get("word", "")
-            accuracy = ws.get("accuracy", 0)
-            error_type = ws.get("error_type", "None")
-
-            # 漏读 (Omission) 或插入 (Insertion)
-            if error_type == "Omission":
-                omitted_words.append(word)
-            elif error_type == "Mispronunciation" or accuracy < 60:
-                mispronounced_words.append({"word": word, "accuracy": int(accuracy)})
-            elif accuracy < 80:
-                problem_words.append({"word": word, "accuracy": int(accuracy)})
+
+        problem_words, omitted_words, mispronounced_words = _partition_word_scores(word_scores)
 
         return {
             "success": True,
@@ -2217,6 +2861,47 @@ class ReadingFeedbackRequest(BaseModel):
     mispronounced_words: Optional[List[dict]] = []
 
 
+# 跟读评价 prompt 的长度上限（短文字符数、各单词列表条数）
+FEEDBACK_PASSAGE_LIMIT = 1500
+FEEDBACK_LIST_LIMIT = 20
+
+# 跟读评价 prompt 模板（模块级常量，每次请求只做 format_map 填充）
+_FEEDBACK_PROMPT = """根据发音评估结果，简洁客观地总结。
+
+短文：{passage}
+各句评分：{scores}
+总体得分：{overall}%
+漏读单词：{omit}
+读错单词：{mis}
+其他问题单词：{other}
+
+要求：
+1. problems: 列出具体问题（漏读哪些词、读错哪些词）
+2. suggestions: 针对漏读和读错的单词，给出1-2条具体练习建议
+
+不要鼓励性语言，直接陈述事实。如果没有漏读或读错，可以不列出。
+
+返回 JSON：
+{{"overall_score": {overall}, "problems": ["具体问题"], "suggestions": ["具体建议"]}}"""
+
+# 无漏读/读错且得分不低于该值时直接返回，不调用 LLM
+FEEDBACK_SKIP_SCORE = 90
+
+
+def _fallback_feedback(score: int, feedback: Optional[str] = None) -> dict:
+    """跟读评价的兜底结果（LLM 不可用/失败/无需调用时返回）"""
+    return {
+        "overall_score": score,
+        "feedback": feedback or f"准确度 {score}%",
+        "problems": [],
+        "suggestions": []
+    }
+
+
+# 跟读评价缓存：key 为 prompt 摘要，同一篇文章的相同跟读结果跨用户复用
+_reading_feedback_cache = TTLCache(maxsize=1024, ttl=24 * 3600)
+
+
 @app.post("/api/reading/feedback")
 async def api_reading_feedback(
     data: ReadingFeedbackRequest,
@@ -2229,118 +2914,159 @@ async def api_reading_feedback(
     """
     if not QWEN_AVAILABLE:
         # 返回默认评价
-        return {
-            "overall_score": data.overall_score,
-            "feedback": f"准确度 {data.overall_score}%",
-            "problems": [],
-            "suggestions": []
-        }
+        return _fallback_feedback(data.overall_score)
 
-    api_key = os.getenv("DASHSCOPE_API_KEY")
-    if not api_key:
-        return {
-            "overall_score": data.overall_score,
-            "feedback": f"你的发音得分是{data.overall_score}分。",
-            "problems": [],
-            "suggestions": []
-        }
+    if not DASHSCOPE_HEADERS:
+        return _fallback_feedback(data.overall_score, f"你的发音得分是{data.overall_score}分。")
+
+    # 没有漏读和读错且高分：无需 LLM 总结
+    if not data.omitted_words and not data.mispronounced_words and data.overall_score >= FEEDBACK_SKIP_SCORE:
+        return _fallback_feedback(data.overall_score)
 
     # 整理各句评分
-    sentence_scores = []
-    problem_phonemes = []
-    for i, result in enumerate(data.sentence_results):
-        if result:
-            score = result.get("accuracy", 0)
-            sentence_scores.append(f"句{i+1}: {score}%")
-            # 收集问题单词/音素
-            for pw in result.get("problemWords", []):
-                problem_phonemes.append(f"{pw.get('word', '')}({pw.get('accuracy', 0)}%)")
+    sentence_scores = [f"句{i+1}: {result.get('accuracy', 0)}%"
+                       for i, result in enumerate(data.sentence_results) if result]
+    # 收集问题单词/音素（跨句去重，保持顺序，限制数量以控制 prompt 长度）
+    problem_phonemes = list(dict.fromkeys(
+        f"{pw.get('word', '')}({pw.get('accuracy', 0)}%)"
+        for result in data.sentence_results if result
+        for pw in result.get("problemWords", [])
+    ))[:FEEDBACK_LIST_LIMIT]
 
     # 整理漏读和读错单词
-    omitted_str = ', '.join(data.omitted_words) if data.omitted_words else '无'
-    mispronounced_str = ', '.join([f"{pw.get('word', '')}({pw.get('accuracy', 0)}%)" for pw in (data.mispronounced_words or [])]) if data.mispronounced_words else '无'
-
-    prompt = f"""根据发音评估结果，简洁客观地总结。
+    omitted = list(dict.fromkeys(data.omitted_words or []))[:FEEDBACK_LIST_LIMIT]
+    mispronounced = list(dict.fromkeys(
+        f"{pw.get('word', '')}({pw.get('accuracy', 0)}%)" for pw in (data.mispronounced_words or [])
+    ))[:FEEDBACK_LIST_LIMIT]
+    omitted_str = ', '.join(omitted) if omitted else '无'
+    mispronounced_str = ', '.join(mispronounced) if mispronounced else '无'
+
+    prompt = _FEEDBACK_PROMPT.format_map({
+        "passage": data.passage[:FEEDBACK_PASSAGE_LIMIT],
+        "scores": ', '.join(sentence_scores),
+        "overall": data.overall_score,
+        "omit": omitted_str,
+        "mis": mispronounced_str,
+        "other": ', '.join(problem_phonemes) if problem_phonemes else '无',
+    })
 
-短文：{data.passage}
-各句评分：{', '.join(sentence_scores)}
-总体得分：{data.overall_score}%
-漏读单词：{omitted_str}
-读错单词：{mispronounced_str}
-其他问题单词：{', '.join(problem_phonemes) if problem_phonemes else '无'}
+    # 缓存和并发合并都以完整 prompt 的摘要为 key：评价取决于文章、各句得分和全部问题单词
+    prompt_key = ("feedback", hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest())
+    cached = _reading_feedback_cache.get(prompt_key)
+    if cached is not None:
+        return {**cached, "overall_score": data.overall_score}
 
-要求：
-1. problems: 列出具体问题（漏读哪些词、读错哪些词）
-2. suggestions: 针对漏读和读错的单词，给出1-2条具体练习建议
+    # 并发提交的相同 prompt 只向 Qwen 发起一次请求
+    try:
+        parsed = await _coalesce(prompt_key, lambda: _generate_reading_feedback(prompt, prompt_key))
+    except Exception:
+        parsed = None
 
-不要鼓励性语言，直接陈述事实。如果没有漏读或读错，可以不列出。
+    if parsed is None:
+        return _fallback_feedback(data.overall_score)
+    return parsed
 
-返回 JSON：
-{{"overall_score": {data.overall_score}, "problems": ["具体问题"], "suggestions": ["具体建议"]}}"""
-
-    try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.post(
-                "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "qwen-plus",
-                    "messages": [
-                        {"role": "system", "content": "你是发音评估助手，客观简洁地总结评估结果，不要鼓励性语言。回复JSON格式。"},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 300
-                }
-            )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                # 解析 JSON（处理可能的 markdown 代码块）
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                return json.loads(content)
-            else:
-                return {
-                    "overall_score": data.overall_score,
-                    "feedback": f"准确度 {data.overall_score}%",
-                    "problems": [],
-                    "suggestions": []
-                }
+async def _generate_reading_feedback(prompt: str, cache_key: tuple) -> Optional[dict]:
+    """调用 Qwen 生成跟读评价，成功时写入缓存并返回解析结果，失败返回 None"""
+    status_code, content = await _qwen_chat_stream(
+        {
+            "model": "qwen-plus",
+            "messages": [
+                {"role": "system", "content": "你是发音评估助手，客观简洁地总结评估结果，不要鼓励性语言。回复JSON格式。"},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3,
+            "max_tokens": 300,
+            "response_format": {"type": "json_object"}
+        },
+        timeout=20.0
+    )
+    if status_code != 200:
+        return None
 
-    except Exception as e:
-        return {
-            "overall_score": data.overall_score,
-            "feedback": f"准确度 {data.overall_score}%",
-            "problems": [],
-            "suggestions": []
-        }
+    # 解析 JSON（处理可能的 markdown 代码块）
+    content = strip_fence(content)
+    parsed = await _json_loads_async(content)
+    _reading_feedback_cache[cache_key] = parsed
+    return parsed
 
 
 @app.get("/api/tts/chinese")
-async def api_tts_chinese(text: str, user: dict = Depends(require_auth)):
+async def api_tts_chinese(text: str, request: Request, user: dict = Depends(require_auth)):
     """生成中文语音（需要认证）- 统一 TTS 服务"""
-    result = await tts_service.synthesize(text=text, language="zh", speed="normal")
-    if not result:
+    # 同一引擎下相同文本的合成结果不变：浏览器重复请求直接 304
+    cache_key = tts_service.make_key(text, "zh", "normal")
+    etag = _tts_etag(cache_key)
+    not_modified = _tts_not_modified(request, etag, cache_key)
+    if not_modified:
+        return not_modified
+
+    audio_data = await tts_service.synthesize_bytes(text=text, language="zh", speed="normal", cache_key=cache_key)
+    if not audio_data:
         raise HTTPException(status_code=503, detail="TTS 服务不可用")
-    return FileResponse(str(result), media_type="audio/mpeg")
+    return Response(
+        content=audio_data, media_type="audio/mpeg",
+        headers={"ETag": etag, "Cache-Control": TTS_CACHE_CONTROL}
+    )
 
 
 # ==================== 阅读理解 API ====================
 
 class ReadingComprehensionRequest(BaseModel):
     difficulty: str = "medium"
+    refresh: bool = False  # 跳过缓存，强制重新生成
 
 
 class ReadingComprehensionSubmit(BaseModel):
-    questions: List[dict]
-    answers: dict  # {"1": "A", "2": "B", ...}
+    questions: List[Dict[str, Any]]
+    answers: Dict[str, str]  # {"1": "A", "2": "B", ...}
+
+
+# 阅读理解生成缓存：按 (难度, 主题) 缓存 1 小时，单次生成耗时数十秒，命中时直接返回
+_reading_comprehension_cache = TTLCache(maxsize=512, ttl=3600)
+
+# 阅读理解预生成池：后台为每个难度保持若干套新题，请求时直接取用（0 表示关闭）
+READING_POOL_SIZE = int(os.getenv("READING_POOL_SIZE", "3"))
+_reading_pool = {}
+
+
+async def _refill_reading_pool(difficulty: str):
+    """后台任务：持续补充某个难度的预生成题目（队列满时阻塞等待）"""
+    queue = _reading_pool[difficulty]
+    while True:
+        system_prompt, user_prompt, topic = get_random_reading_prompt(difficulty)
+        cache_key = ("reading_comprehension", difficulty, topic)
+        try:
+            item = await _generate_reading_comprehension(
+                system_prompt, user_prompt, topic, difficulty, cache_key
+            )
+        except Exception as e:
+            detail = e.detail if isinstance(e, HTTPException) else e
+            print(f"[阅读理解] 预生成失败（{difficulty}）: {detail}")
+            await asyncio.sleep(60)
+            continue
+        await queue.put(item)
+
+
+@app.on_event("startup")
+async def startup_reading_pool():
+    """启动阅读理解预生成任务"""
+    if not QWEN_AVAILABLE or not DASHSCOPE_HEADERS or READING_POOL_SIZE <= 0:
+        return
+
+    tasks = []
+    for difficulty in TOPIC_POOLS:
+        _reading_pool[difficulty] = asyncio.Queue(maxsize=READING_POOL_SIZE)
+        tasks.append(asyncio.create_task(_refill_reading_pool(difficulty)))
+    app.state.reading_pool_tasks = tasks  # 保存引用防止任务被回收
+
+
+@app.on_event("shutdown")
+async def shutdown_reading_pool():
+    """停止阅读理解预生成任务"""
+    for task in getattr(app.state, "reading_pool_tasks", []):
+        task.cancel()
 
 
 @app.post("/api/reading-comprehension/generate")
@@ -2349,54 +3075,65 @@ async def api_reading_comprehension_generate(data: ReadingComprehensionRequest,
     if not QWEN_AVAILABLE:
         raise HTTPException(status_code=503, detail="Qwen 服务不可用")
 
-    api_key = os.getenv("DASHSCOPE_API_KEY")
-    if not api_key:
+    if not DASHSCOPE_HEADERS:
         raise HTTPException(status_code=503, detail="未配置 DASHSCOPE_API_KEY")
 
-    # 导入提示词模块
-    from prompts.api_prompts import get_random_reading_prompt
+    # 优先取预生成池中的新题
+    queue = _reading_pool.get(data.difficulty)
+    if queue is not None:
+        try:
+            return queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
 
     # 获取随机主题的提示词
     system_prompt, user_prompt, topic = get_random_reading_prompt(data.difficulty)
 
+    cache_key = ("reading_comprehension", data.difficulty, topic)
+    if not data.refresh:
+        cached = _reading_comprehension_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    # 相同难度和主题的并发请求只调用一次 Qwen
+    return await _coalesce(cache_key, lambda: _generate_reading_comprehension(
+        system_prompt, user_prompt, topic, data.difficulty, cache_key
+    ))
+
+
+async def _generate_reading_comprehension(system_prompt: str, user_prompt: str,
+                                          topic: str, difficulty: str, cache_key: tuple) -> dict:
+    """调用 Qwen 生成阅读理解，成功结果写入缓存"""
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "qwen-plus",
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 4000
-                }
-            )
+        # 长文本生成耗时数十秒，流式接收
+        status_code, content = await _qwen_chat_stream(
+            {
+                "model": "qwen-plus",
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                "temperature": 0.7,
+                "max_tokens": 4000,
+                "response_format": {"type": "json_object"}
+            },
+            timeout=120.0
+        )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-
-                # 解析 JSON（处理可能的 markdown 代码块）
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-
-                parsed = json.loads(content)
-                parsed["topic"] = topic
-                parsed["difficulty"] = data.difficulty
-                return parsed
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"API 返回错误: {response.text}"
-                )
+        if status_code == 200:
+            # 解析 JSON（处理可能的 markdown 代码块）
+            content = strip_fence(content)
+
+            parsed = await _json_loads_async(content)
+            parsed["topic"] = topic
+            parsed["difficulty"] = difficulty
+            _reading_comprehension_cache[cache_key] = parsed
+            return parsed
+        else:
+            raise HTTPException(
+                status_code=status_code,
+                detail=f"API 返回错误: {content}"
+            )
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=500, detail=f"JSON 解析失败: {str(e)}")
     except httpx.TimeoutException:
@@ -2408,28 +3145,21 @@ async def api_reading_comprehension_generate(data: ReadingComprehensionRequest,
 @app.post("/api/reading-comprehension/submit")
 async def api_reading_comprehension_submit(data: ReadingComprehensionSubmit, user: dict = Depends(require_auth)):
     """提交答案并返回结果"""
-    results = []
-    correct_count = 0
-
-    for q in data.questions:
-        q_num = str(q["number"])
-        user_answer = data.answers.get(q_num, "")
-        correct_answer = q["answer"]
-        is_correct = user_answer.upper() == correct_answer.upper()
-
-        if is_correct:
-            correct_count += 1
-
-        results.append({
+    answers_get = data.answers.get
+    results = [
+        {
             "number": q["number"],
-            "user_answer": user_answer,
-            "correct_answer": correct_answer,
-            "is_correct": is_correct,
+            "user_answer": (user_answer := answers_get(str(q["number"]), "")),
+            "correct_answer": (correct_answer := q["answer"]),
+            "is_correct": user_answer.upper() == correct_answer.upper(),
             "explanation": q.get("explanation", "")
-        })
+        }
+        for q in data.questions
+    ]
+    correct_count = sum(r["is_correct"] for r in results)
 
-    total = len(data.questions)
-    score = int((correct_count / total) * 100) if total > 0 else 0
+    total = len(results)
+    score = correct_count * 100 // total if total else 0
 
     return {
         "results": results,
@@ -2583,12 +3313,12 @@ def get_or_generate_confusing(db: Session, word: str, word_pool: list) -> list:
     import random
 
     # 获取目标单词的同义词，从选项中排除
-    target_synonyms = synonym_index.get_synonyms(word)
+    target_synonyms = get_synonym_index().get_synonyms(word)
     exclude_set = {word} | target_synonyms
 
     cached = db.query(ConfusingWords).filter(ConfusingWords.word == word).first()
     if cached:
-        confusing = json.loads(cached.confusing)
+        confusing = json_loads(cached.confusing)
         # 去重并排除正确答案和同义词
         confusing = [c for c in confusing if c not in exclude_set and c in word_pool]
         confusing = list(dict.fromkeys(confusing))[:3]
@@ -2608,7 +3338,7 @@ def get_or_generate_confusing(db: Session, word: str, word_pool: list) -> list:
 
     cache_entry = ConfusingWords(
         word=word,
-        confusing=json.dumps(confusing, ensure_ascii=False)
+        confusing=json_dumps(confusing)
     )
     db.add(cache_entry)
     db.commit()
@@ -2632,7 +3362,7 @@ def pregenerate_confusing_words(words: list, word_pool: list):
                 confusing = generate_confusing_by_llm(word, word_pool)
                 cache_entry = ConfusingWords(
                     word=word,
-                    confusing=json.dumps(confusing, ensure_ascii=False)
+                    confusing=json_dumps(confusing)
                 )
                 db.add(cache_entry)
         db.commit()
@@ -2656,15 +3386,11 @@ def generate_confusing_by_llm(word: str, word_pool: list) -> list:
 
     try:
         if QWEN_AVAILABLE:
-            api_key = os.getenv("DASHSCOPE_API_KEY")
-            if api_key:
+            if DASHSCOPE_HEADERS:
                 with sync_httpx.Client(timeout=15.0) as client:
                     response = client.post(
                         "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {api_key}",
-                            "Content-Type": "application/json"
-                        },
+                        headers=DASHSCOPE_HEADERS,
                         json={
                             "model": "qwen-plus",
                             "messages": [{"role": "user", "content": prompt}],
@@ -2672,7 +3398,7 @@ def generate_confusing_by_llm(word: str, word_pool: list) -> list:
                         }
                     )
                     if response.status_code == 200:
-                        data = response.json()
+                        data = json_loads(response.content)
                         content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
                         words = [w.strip() for w in content.split(',') if w.strip() in word_pool]
                         if len(words) >= 3:
@@ -2757,6 +3483,7 @@ async def submit_assessment(
         if data.selected and data.selected != data.word:
             record_confusion(db, user["id"], data.word, data.selected)
 
+    _invalidate_stats(user["id"])
     return {"status": "ok"}
 
 
@@ -2786,4 +3513,22 @@ def record_confusion(db: Session, user_id: int, correct_word: str, selected_word
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        # Windows 等平台没有 uvloop，退回默认事件循环
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+
+    # 例句/统计缓存、阅读题预生成池等都在进程内，默认单 worker；多 worker 需自行评估
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
+    if workers > 1:
+        uvicorn.run("server:app", host="0.0.0.0", port=8000, loop=loop, http=http, workers=workers)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop, http=http)
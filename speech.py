@@ -12,11 +12,22 @@ Usage:
     result = await recognizer.recognize_from_bytes(audio_data)
 """
 
+import io
+import json
 import os
 import tempfile
 import asyncio
-import threading
-from typing import Optional
+import atexit
+import mmap
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+
+from cachetools import TTLCache
+
+from httputil import HTTP2_AVAILABLE
+from jsonutil import json_dumps, json_loads, strip_fence
 
 # Azure Speech SDK
 try:
@@ -26,6 +37,153 @@ except ImportError:
     AZURE_SPEECH_AVAILABLE = False
     speechsdk = None
 
+# 音频数据：bytes 或零拷贝视图（memoryview/mmap），写文件和 base64 编码都直接支持
+AudioData = Union[bytes, bytearray, memoryview]
+
+# 阻塞的语音 SDK 调用（Azure / 腾讯 SOE / DashScope）专用线程池，
+# 与默认线程池隔离，一批长时间的识别/评测不会拖慢应用里其他 to_thread 调用
+SPEECH_POOL_WORKERS = int(os.getenv("SPEECH_POOL_WORKERS", "8"))
+_SPEECH_POOL = ThreadPoolExecutor(max_workers=SPEECH_POOL_WORKERS, thread_name_prefix="speech")
+atexit.register(_SPEECH_POOL.shutdown, wait=False)
+
+# PyAV 可选（进程内解码音频，省去 ffmpeg 子进程启动和临时文件；未安装时回退 ffmpeg）
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    av = None
+    PYAV_AVAILABLE = False
+
+
+def _decode_to_wav_sync(audio_data: AudioData) -> Optional[bytes]:
+    """用 PyAV 在进程内解码并重采样为 WAV（16k/16bit/mono），失败返回 None"""
+    resampler = av.audio.resampler.AudioResampler(format="s16", layout="mono", rate=16000)
+    pcm = bytearray()
+
+    def append(frames):
+        for frame in frames:
+            # s16 单声道为 packed 单平面，平面缓冲区可能有对齐填充，按样本数截取
+            pcm.extend(memoryview(frame.planes[0])[:frame.samples * 2])
+
+    try:
+        with av.open(io.BytesIO(audio_data)) as container:
+            for frame in container.decode(audio=0):
+                append(resampler.resample(frame))
+        append(resampler.resample(None))  # 取出重采样器中剩余的样本
+    except Exception as e:
+        print(f"[PyAV] 解码失败，回退 ffmpeg: {e}")
+        return None
+
+    if not pcm:
+        return None
+
+    out = io.BytesIO()
+    with wave.open(out, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(pcm)
+    return out.getvalue()
+
+
+async def _decode_to_wav(audio_data: AudioData) -> Optional[bytes]:
+    """进程内解码为 WAV（在线程池中执行）；PyAV 不可用或解码失败返回 None，由调用方回退 ffmpeg"""
+    if not PYAV_AVAILABLE:
+        return None
+    return await asyncio.to_thread(_decode_to_wav_sync, audio_data)
+
+
+async def _convert_to_wav(audio_data: AudioData, source_ext: str, tag: str = "[FFmpeg]") -> Optional[bytes]:
+    """
+    将音频转换为 WAV 格式（16k/16bit/mono，Azure/SOE/Qwen-ASR 通用）
+
+    优先用 PyAV 在进程内解码，不可用或失败时写临时文件交给 ffmpeg。
+    tag 为日志前缀，区分调用方。失败返回 None
+    """
+    if len(audio_data) < 1000:
+        print(f"{tag} 音频数据太小: {len(audio_data)} bytes")
+        return None
+
+    wav_data = await _decode_to_wav(audio_data)
+    if wav_data is not None:
+        return wav_data
+
+    with tempfile.NamedTemporaryFile(suffix=source_ext, delete=False) as src_file:
+        src_file.write(audio_data)
+        src_path = src_file.name
+
+    try:
+        dst_path = await _ffmpeg_to_wav_file(src_path, tag)
+        if dst_path is None:
+            return None
+        try:
+            with open(dst_path, "rb") as f:
+                return f.read()
+        finally:
+            try:
+                os.unlink(dst_path)
+            except:
+                pass
+    finally:
+        try:
+            os.unlink(src_path)
+        except:
+            pass
+
+
+async def _ffmpeg_to_wav_file(src_path: str, tag: str) -> Optional[str]:
+    """
+    按文件路径调用 ffmpeg 转换为 WAV（16k/16bit/mono）
+
+    用于大文件上传：源音频已落盘，直接交给 ffmpeg，不经过内存中的 bytes。
+    返回转换后的临时 WAV 路径（由调用方删除），失败返回 None
+    """
+    dst_path = tempfile.mktemp(suffix=".wav")
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-i", src_path,
+            "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1", "-f", "wav",
+            dst_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+
+        if process.returncode != 0:
+            print(f"{tag} FFmpeg 转换失败: {stderr.decode()}")
+        elif os.path.exists(dst_path):
+            return dst_path
+    except Exception as e:
+        print(f"{tag} 音频转换异常: {e}")
+
+    try:
+        os.unlink(dst_path)
+    except:
+        pass
+    return None
+
+
+def _parse_pcm_wav(data: AudioData) -> Optional[Tuple[bytes, int, int, int]]:
+    """解析 PCM WAV，返回 (PCM 数据, 采样率, 位深, 声道数)；非 PCM 或格式异常返回 None"""
+    try:
+        with wave.open(io.BytesIO(data)) as w:
+            return w.readframes(w.getnframes()), w.getframerate(), w.getsampwidth() * 8, w.getnchannels()
+    except (wave.Error, EOFError):
+        return None
+
+
+@lru_cache(maxsize=8)
+def _get_speech_config(key: str, region: str, language: str):
+    """
+    获取 Azure SpeechConfig（按 key/区域/语言缓存）
+
+    SpeechConfig 构造会做原生层初始化和参数校验，创建后只读，可在多次识别间共享；
+    只有绑定音频文件的 AudioConfig 和 SpeechRecognizer 需要每次新建
+    """
+    speech_config = speechsdk.SpeechConfig(subscription=key, region=region)
+    speech_config.speech_recognition_language = language
+    return speech_config
+
 
 class SpeechRecognizer:
     """Azure Speech 语音识别器"""
@@ -38,13 +196,32 @@ class SpeechRecognizer:
         """检查服务是否可用"""
         return AZURE_SPEECH_AVAILABLE and bool(self.speech_key)
 
-    def _recognize_sync(self, audio_path: str) -> dict:
+    @staticmethod
+    def _pcm_audio_config(pcm: bytes, sample_rate: int, bits_per_sample: int, channels: int):
         """
-        同步识别音频文件（内部方法）
-        使用连续识别模式，支持较长的语音输入
+        内存中的 PCM 数据 → AudioConfig
+
+        通过 PushAudioInputStream 直接把音频交给 SDK，不写临时文件
+        """
+        stream_format = speechsdk.audio.AudioStreamFormat(
+            samples_per_second=sample_rate,
+            bits_per_sample=bits_per_sample,
+            channels=channels
+        )
+        push_stream = speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
+        push_stream.write(pcm)
+        push_stream.close()
+        return speechsdk.audio.AudioConfig(stream=push_stream)
+
+    async def _recognize(self, make_audio_config) -> dict:
+        """
+        使用连续识别模式识别（内部方法），支持较长的语音输入
+
+        只有创建识别器、启动/停止识别这些短调用放到线程池；等待识别结束通过
+        SDK 回调唤醒 Future，不再用 threading.Event 占住一个线程池线程长达 30 秒
 
         Args:
-            audio_path: 音频文件路径
+            make_audio_config: 创建 AudioConfig 的函数（文件或内存流）
 
         Returns:
             识别结果字典
@@ -52,22 +229,26 @@ class SpeechRecognizer:
         if not self.is_available():
             return {"success": False, "text": "", "error": "Azure Speech 未配置"}
 
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+
+        def set_done():
+            if not done.done():
+                done.set_result(None)
+
         try:
-            speech_config = speechsdk.SpeechConfig(
-                subscription=self.speech_key,
-                region=self.speech_region
-            )
-            speech_config.speech_recognition_language = "en-US"
+            speech_config = _get_speech_config(self.speech_key, self.speech_region, "en-US")
 
-            audio_config = speechsdk.AudioConfig(filename=audio_path)
-            recognizer = speechsdk.SpeechRecognizer(
-                speech_config=speech_config,
-                audio_config=audio_config
+            recognizer = await loop.run_in_executor(
+                _SPEECH_POOL,
+                lambda: speechsdk.SpeechRecognizer(
+                    speech_config=speech_config,
+                    audio_config=make_audio_config()
+                )
             )
 
-            # 使用连续识别收集完整音频中的所有语句
+            # 使用连续识别收集完整音频中的所有语句（回调在 SDK 线程中触发）
             all_texts = []
-            done_event = threading.Event()
             error_info = {"error": None}
 
             def on_recognized(evt):
@@ -78,18 +259,22 @@ class SpeechRecognizer:
                 cancellation = evt.cancellation_details
                 if cancellation.reason == speechsdk.CancellationReason.Error:
                     error_info["error"] = f"识别取消: {cancellation.reason}, {cancellation.error_details}"
-                done_event.set()
+                loop.call_soon_threadsafe(set_done)
 
             def on_session_stopped(evt):
-                done_event.set()
+                loop.call_soon_threadsafe(set_done)
 
             recognizer.recognized.connect(on_recognized)
             recognizer.canceled.connect(on_canceled)
             recognizer.session_stopped.connect(on_session_stopped)
 
-            recognizer.start_continuous_recognition()
-            done_event.wait(timeout=30)
-            recognizer.stop_continuous_recognition()
+            await loop.run_in_executor(_SPEECH_POOL, recognizer.start_continuous_recognition)
+            try:
+                await asyncio.wait_for(done, timeout=30)
+            except asyncio.TimeoutError:
+                pass  # 超时后按已识别的内容返回
+            finally:
+                await loop.run_in_executor(_SPEECH_POOL, recognizer.stop_continuous_recognition)
 
             if error_info["error"]:
                 return {"success": False, "text": "", "error": error_info["error"]}
@@ -123,11 +308,9 @@ class SpeechRecognizer:
                 "error": None
             }
         """
-        # 在线程池中运行同步识别
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._recognize_sync, audio_path)
+        return await self._recognize(lambda: speechsdk.AudioConfig(filename=audio_path))
 
-    async def recognize_from_bytes(self, audio_data: bytes, file_ext: str = ".wav") -> dict:
+    async def recognize_from_bytes(self, audio_data: AudioData, file_ext: str = ".wav") -> dict:
         """
         从音频字节流识别（用于前端上传）
 
@@ -143,13 +326,19 @@ class SpeechRecognizer:
 
         # 需要将 webm 转换为 wav 格式
         if file_ext in [".webm", ".ogg", ".mp4", ".m4a"]:
-            converted_data = await self._convert_to_wav(audio_data, file_ext)
+            converted_data = await _convert_to_wav(audio_data, file_ext, "[FFmpeg]")
             if converted_data is None:
                 return {"success": False, "text": "", "error": "音频格式转换失败"}
             audio_data = converted_data
             file_ext = ".wav"
 
-        # 临时保存文件后识别
+        # PCM WAV 直接推流给 SDK，不经过临时文件
+        if file_ext == ".wav":
+            pcm_info = _parse_pcm_wav(audio_data)
+            if pcm_info is not None:
+                return await self._recognize(lambda: self._pcm_audio_config(*pcm_info))
+
+        # 其他格式（或非 PCM 的 WAV）临时保存文件后识别
         with tempfile.NamedTemporaryFile(suffix=file_ext, delete=False) as f:
             f.write(audio_data)
             temp_path = f.name
@@ -162,76 +351,19 @@ class SpeechRecognizer:
             except:
                 pass
 
-    async def _convert_to_wav(self, audio_data: bytes, source_ext: str) -> Optional[bytes]:
-        """
-        将音频转换为 Azure Speech SDK 兼容的 WAV 格式
-
-        Azure Speech 需要特定格式:
-        - PCM 16-bit
-        - 16kHz 采样率
-        - 单声道
-        - 标准 RIFF WAV 头
-        """
-        import subprocess
-
-        # 创建临时文件
-        with tempfile.NamedTemporaryFile(suffix=source_ext, delete=False) as src_file:
-            src_file.write(audio_data)
-            src_path = src_file.name
-
-        # 使用不同的文件名避免冲突
-        dst_path = tempfile.mktemp(suffix=".wav")
-
-        try:
-            # 使用 ffmpeg 转换 - 添加 -f wav 确保输出格式正确
-            process = await asyncio.create_subprocess_exec(
-                "ffmpeg",
-                "-y",                    # 覆盖输出文件
-                "-i", src_path,          # 输入文件
-                "-acodec", "pcm_s16le",  # PCM 16-bit little-endian
-                "-ar", "16000",          # 16kHz 采样率
-                "-ac", "1",              # 单声道
-                "-f", "wav",             # 强制 WAV 格式
-                dst_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
-                print(f"[FFmpeg] 转换失败: {stderr.decode()}")
-                return None
-
-            if os.path.exists(dst_path):
-                with open(dst_path, "rb") as f:
-                    wav_data = f.read()
-                print(f"[FFmpeg] 转换成功: {len(audio_data)} -> {len(wav_data)} bytes")
-                return wav_data
-            return None
-
-        except Exception as e:
-            print(f"[FFmpeg] 音频转换异常: {e}")
-            return None
-
-        finally:
-            # 清理临时文件
-            try:
-                os.unlink(src_path)
-            except:
-                pass
-            try:
-                os.unlink(dst_path)
-            except:
-                pass
-
 
 class PronunciationAssessor:
     """腾讯云智聆口语评测 (SOE) 发音评估器"""
 
+    # 同时进行的 SOE 评测数上限（按账号并发配额设置；超出的请求排队，避免触发限流）。
+    # 评测与识别共用语音线程池，上限不超过池的一半，突发评测不会占满池、让识别请求排队
+    MAX_CONCURRENT_ASSESS = max(1, min(int(os.getenv("SOE_MAX_CONCURRENCY", "16")), SPEECH_POOL_WORKERS // 2))
+
     def __init__(self):
         self.secret_id = os.getenv("TENCENT_SECRET_ID")
         self.secret_key = os.getenv("TENCENT_SECRET_KEY")
         self._client = None
+        self._assess_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ASSESS)
 
     def is_available(self) -> bool:
         """检查服务是否可用"""
@@ -246,7 +378,19 @@ class PronunciationAssessor:
             self._client = soe_client.SoeClient(cred, "")
         return self._client
 
-    def _assess_sync(self, wav_data: bytes, reference_text: str, eval_mode: int = 0) -> dict:
+    def _assess_file_sync(self, wav_path: str, reference_text: str, eval_mode: int) -> dict:
+        """
+        同步评估 WAV 文件（内部方法）
+
+        mmap 映射文件，以 memoryview 直接交给 base64 编码，不在 Python 堆上复制一份；
+        映射在工作线程内创建和释放，等待方被取消时不会提前关闭仍在读取的映射
+        """
+        with open(wav_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            return self._assess_sync(view, reference_text, eval_mode)
+
+    def _assess_sync(self, wav_data: AudioData, reference_text: str, eval_mode: int = 0) -> dict:
         """
         同步发音评估（内部方法）
 
@@ -260,7 +404,6 @@ class PronunciationAssessor:
 
         import base64
         import uuid
-        import json
 
         print(f"[SOE] 开始评估, 音频: {len(wav_data)} bytes, 模式: {eval_mode}")
         print(f"[SOE] 参考文本: {reference_text[:100]}")
@@ -286,10 +429,11 @@ class PronunciationAssessor:
                 "IsEnd": 1,
                 "UserVoiceData": voice_data,
             }
-            req.from_json_string(json.dumps(params))
+            # 参数中含整段 base64 音频，orjson 序列化明显快于标准库
+            req.from_json_string(json_dumps(params))
 
             resp = client.TransmitOralProcessWithInit(req)
-            result = json.loads(resp.to_json_string())
+            result = json_loads(resp.to_json_string())
 
             print(f"[SOE] SuggestedScore={result.get('SuggestedScore')}, "
                   f"PronAccuracy={result.get('PronAccuracy')}, "
@@ -353,7 +497,7 @@ class PronunciationAssessor:
             print(f"[SOE] 评估异常: {e}")
             return {"success": False, "error": str(e)}
 
-    async def assess_from_bytes(self, audio_data: bytes, reference_text: str,
+    async def assess_from_bytes(self, audio_data: AudioData, reference_text: str,
                                  file_ext: str = ".wav") -> dict:
         """从音频字节流进行发音评估"""
         if not self.is_available():
@@ -361,73 +505,91 @@ class PronunciationAssessor:
 
         # 转换音频格式为 WAV（16k/16bit/mono）
         if file_ext != ".wav":
-            converted_data = await self._convert_to_wav(audio_data, file_ext)
+            converted_data = await _convert_to_wav(audio_data, file_ext, "[SOE]")
             if converted_data is None:
                 return {"success": False, "error": "音频格式转换失败"}
             audio_data = converted_data
 
-        # 根据参考文本判断评测模式
+        eval_mode = self._eval_mode(reference_text)
+        async with self._assess_semaphore:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                _SPEECH_POOL, self._assess_sync, audio_data, reference_text, eval_mode
+            )
+
+    @staticmethod
+    def _eval_mode(reference_text: str) -> int:
+        """根据参考文本的单词数判断评测模式"""
         word_count = len(reference_text.split())
         if word_count <= 2:
-            eval_mode = 0  # 单词
+            return 0  # 单词
         elif word_count <= 20:
-            eval_mode = 1  # 句子
-        else:
-            eval_mode = 2  # 段落
-
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self._assess_sync, audio_data, reference_text, eval_mode
-        )
-
-    async def _convert_to_wav(self, audio_data: bytes, source_ext: str) -> Optional[bytes]:
-        """将音频转换为 WAV 格式（16k/16bit/mono）"""
-        if len(audio_data) < 1000:
-            print(f"[FFmpeg] 音频数据太小: {len(audio_data)} bytes")
-            return None
+            return 1  # 句子
+        return 2  # 段落
 
-        print(f"[FFmpeg] 开始转换: {len(audio_data)} bytes, 格式: {source_ext}")
-
-        with tempfile.NamedTemporaryFile(suffix=source_ext, delete=False) as src_file:
-            src_file.write(audio_data)
-            src_path = src_file.name
+    async def assess_from_file(self, audio_path: str, reference_text: str,
+                                file_ext: str = ".wav") -> dict:
+        """
+        从已落盘的音频文件进行发音评估（大文件上传使用）
 
-        dst_path = tempfile.mktemp(suffix=".wav")
+        非 WAV 格式由 ffmpeg 直接按路径转换，转换后的 WAV 通过 mmap 读取
+        """
+        if not self.is_available():
+            return {"success": False, "error": "腾讯云 SOE 服务未配置"}
 
+        wav_path = None
         try:
-            process = await asyncio.create_subprocess_exec(
-                "ffmpeg", "-y", "-i", src_path,
-                "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1", "-f", "wav",
-                dst_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
+            # 与 _convert_to_wav 一致：音频过小（含空文件，mmap 无法映射）直接返回失败
+            file_size = os.path.getsize(audio_path)
+            if file_size < 1000:
+                print(f"[SOE] 音频数据太小: {file_size} bytes")
+                return {"success": False, "error": "音频格式转换失败"}
 
-            if process.returncode != 0:
-                print(f"[FFmpeg] 转换失败: {stderr.decode()}")
-                return None
+            if file_ext != ".wav":
+                wav_path = await _ffmpeg_to_wav_file(audio_path, "[SOE]")
+                if wav_path is None:
+                    return {"success": False, "error": "音频格式转换失败"}
+                audio_path = wav_path
+            eval_mode = self._eval_mode(reference_text)
+            async with self._assess_semaphore:
+                loop = asyncio.get_event_loop()
+                return await loop.run_in_executor(
+                    _SPEECH_POOL, self._assess_file_sync, audio_path, reference_text, eval_mode
+                )
+        except Exception as e:
+            print(f"[SOE] 评估异常: {e}")
+            return {"success": False, "error": str(e)}
+        finally:
+            if wav_path:
+                try:
+                    os.unlink(wav_path)
+                except:
+                    pass
 
-            if os.path.exists(dst_path):
-                with open(dst_path, "rb") as f:
-                    wav_data = f.read()
-                print(f"[FFmpeg] 转换成功: {len(audio_data)} -> {len(wav_data)} bytes")
-                return wav_data
-            return None
 
-        except Exception as e:
-            print(f"[FFmpeg] 音频转换异常: {e}")
-            return None
+def _classify_phonemes(phoneme_details: list, threshold: float,
+                       missing_error_type: Optional[str] = "None") -> list:
+    """
+    单次遍历筛选问题音素（得分低于阈值或有错误类型）
 
-        finally:
-            try:
-                os.unlink(src_path)
-            except:
-                pass
-            try:
-                os.unlink(dst_path)
-            except:
-                pass
+    Args:
+        phoneme_details: 音素详情列表
+        threshold: 得分阈值，低于此分数视为有问题
+        missing_error_type: 缺少 error_type 字段时使用的值（"None" 表示无错误，
+            None 表示视为有错误类型，即作为问题音素）
+
+    Returns:
+        [(phoneme, accuracy, error_type), ...]，保持原顺序
+    """
+    problems = []
+    append = problems.append
+    for p in phoneme_details:
+        get = p.get
+        accuracy = get("accuracy", 100)
+        error_type = get("error_type", missing_error_type)
+        if accuracy < threshold or error_type != "None":
+            append((get("phoneme", ""), accuracy, error_type))
+    return problems
 
 
 def generate_feedback_text(assessment_result: dict, word: str) -> str:
@@ -445,13 +607,8 @@ def generate_feedback_text(assessment_result: dict, word: str) -> str:
         return "没有听清楚，请再试一次。"
 
     accuracy = assessment_result.get("accuracy_score", 0)
-    phoneme_details = assessment_result.get("phoneme_details", [])
-
-    # 找出发音有问题的音素
-    problem_phonemes = [
-        p for p in phoneme_details
-        if p.get("accuracy", 100) < 60 or p.get("error_type") != "None"
-    ]
+    # 找出发音有问题的音素（缺少 error_type 的音素同样视为有问题）
+    problem_phonemes = _classify_phonemes(assessment_result.get("phoneme_details", []), 60, None)
 
     if accuracy >= 90:
         return "非常好！发音很标准。"
@@ -459,24 +616,53 @@ def generate_feedback_text(assessment_result: dict, word: str) -> str:
         return "不错！发音基本正确。"
     elif accuracy >= 60:
         if problem_phonemes:
-            phoneme_str = "、".join([p["phoneme"] for p in problem_phonemes[:3]])
+            phoneme_str = "、".join([phoneme for phoneme, _, _ in problem_phonemes[:3]])
             return f"还可以，注意 {phoneme_str} 的发音。"
         return "还可以，继续练习。"
     else:
         if problem_phonemes:
             # 分析错误类型
-            omissions = [p for p in problem_phonemes if p.get("error_type") == "Omission"]
-            if omissions:
+            if any(error_type == "Omission" for _, _, error_type in problem_phonemes):
                 return "有些音漏掉了，再听一遍标准发音。"
             return "发音需要改进，请仔细听标准发音后再试。"
         return "发音需要改进，请再试一次。"
 
 
+# ==================== DashScope HTTP 客户端 ====================
+
+# 共享的 DashScope HTTP 客户端（延迟创建）：复用 TCP/TLS 连接，避免每次点评/评价重新握手
+_http_client = None
+
+
+def _get_http_client():
+    """获取共享的 httpx.AsyncClient（装了 h2 时启用 HTTP/2，点评和翻译评价请求复用同一连接）"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        import httpx
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=120.0)
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """关闭共享客户端（应用关闭时调用）"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 # ==================== 大模型智能点评 ====================
 
 # 准确度阈值：低于此值触发大模型点评和练习推荐
 ACCURACY_THRESHOLD = 75
 
+# 智能点评缓存：提示词只取决于单词、分数段和问题音素，同班学生读错同一单词时跨用户复用
+_ai_feedback_cache = TTLCache(maxsize=2048, ttl=24 * 3600)
+
 
 async def generate_ai_feedback(
     word: str,
@@ -510,12 +696,25 @@ async def generate_ai_feedback(
         return _generate_basic_feedback(word, accuracy_score, phoneme_details)
 
     # 找出问题音素（阈值75分，低于此分数需要练习）
+    problems = _classify_phonemes(phoneme_details, 75)
     problem_phonemes = [
-        {"phoneme": p["phoneme"], "accuracy": p.get("accuracy", 0)}
-        for p in phoneme_details
-        if p.get("accuracy", 100) < 75 or p.get("error_type", "None") != "None"
+        {"phoneme": phoneme, "accuracy": accuracy}
+        for phoneme, accuracy, _ in problems
     ]
 
+    # 所有音素都>=75分：提示词要求此时只回复"发音正确"且不推荐单词，与基础反馈一致，无需请求大模型
+    if not problems:
+        return _generate_basic_feedback(word, accuracy_score, phoneme_details, problems)
+
+    cache_key = (
+        word.lower(),
+        round(accuracy_score / 5) * 5,
+        tuple(sorted((phoneme, round(accuracy / 10) * 10) for phoneme, accuracy, _ in problems))
+    )
+    cached = _ai_feedback_cache.get(cache_key)
+    if cached is not None:
+        return {**cached, "problem_phonemes": problem_phonemes}
+
     # 构建提示词
     phoneme_info = "\n".join([
         f"- /{p['phoneme']}/: {p['accuracy']:.0f}分"
@@ -525,8 +724,8 @@ async def generate_ai_feedback(
     problem_info = ""
     if problem_phonemes:
         problem_info = "问题音素：" + ", ".join([
-            f"/{p['phoneme']}/ ({p['accuracy']:.0f}分)"
-            for p in problem_phonemes
+            f"/{phoneme}/ ({accuracy:.0f}分)"
+            for phoneme, accuracy, _ in problems
         ])
 
     prompt = f"""你是一个专业的英语发音教练。请根据评估结果直接指出问题，不要使用空洞的表扬。
@@ -563,77 +762,86 @@ async def generate_ai_feedback(
    - 只有所有音素>=75分时才可以为空数组"""
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.post(
-                "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "qwen-plus",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.7,
-                    "max_tokens": 200
+        client = _get_http_client()
+        # 冷连接上偶发的连接失败/读超时重试一次，避免直接退回基础反馈
+        for attempt in range(2):
+            try:
+                response = await client.post(
+                    "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    json={
+                        "model": "qwen-plus",
+                        "messages": [{"role": "user", "content": prompt}],
+                        "temperature": 0.7,
+                        "max_tokens": 200,
+                        "response_format": {"type": "json_object"}
+                    },
+                    timeout=15.0
+                )
+                break
+            except (httpx.ReadTimeout, httpx.ConnectError):
+                if attempt == 1:
+                    raise
+
+        if response.status_code == 200:
+            data = json_loads(response.content)
+            content = data["choices"][0]["message"]["content"]
+
+            # 提取 JSON 部分（支持嵌套）
+            # 找到第一个 { 和最后一个 } 之间的内容
+            start_idx = content.find('{')
+            end_idx = content.rfind('}')
+            if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
+                json_str = content[start_idx:end_idx + 1]
+                ai_result = json_loads(json_str)
+
+                # 获取大模型推荐的练习单词（现在是对象数组）
+                practice_words = ai_result.get("practice_words", [])
+                # 确保是对象格式，并过滤掉当前单词
+                filtered_words = []
+                for pw in practice_words:
+                    if isinstance(pw, dict):
+                        pw_word = pw.get("word", "")
+                        if pw_word.lower() != word.lower():
+                            filtered_words.append({
+                                "word": pw_word,
+                                "pos": pw.get("pos", ""),
+                                "meaning": pw.get("meaning", "")
+                            })
+                    elif isinstance(pw, str) and pw.lower() != word.lower():
+                        # 兼容旧格式（纯字符串）
+                        filtered_words.append({"word": pw, "pos": "", "meaning": ""})
+                practice_words = filtered_words[:3]
+
+                feedback = {
+                    "feedback": ai_result.get("feedback", "继续练习！"),
+                    "tips": ai_result.get("tips", ""),
+                    "practice_words": practice_words,
+                    "problem_phonemes": problem_phonemes,
+                    "focus_phoneme": ai_result.get("focus_phoneme", "")
                 }
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-
-                # 解析 JSON 响应
-                import json
-                import re
-
-                # 提取 JSON 部分（支持嵌套）
-                # 找到第一个 { 和最后一个 } 之间的内容
-                start_idx = content.find('{')
-                end_idx = content.rfind('}')
-                if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
-                    json_str = content[start_idx:end_idx + 1]
-                    ai_result = json.loads(json_str)
-
-                    # 获取大模型推荐的练习单词（现在是对象数组）
-                    practice_words = ai_result.get("practice_words", [])
-                    # 确保是对象格式，并过滤掉当前单词
-                    filtered_words = []
-                    for pw in practice_words:
-                        if isinstance(pw, dict):
-                            pw_word = pw.get("word", "")
-                            if pw_word.lower() != word.lower():
-                                filtered_words.append({
-                                    "word": pw_word,
-                                    "pos": pw.get("pos", ""),
-                                    "meaning": pw.get("meaning", "")
-                                })
-                        elif isinstance(pw, str) and pw.lower() != word.lower():
-                            # 兼容旧格式（纯字符串）
-                            filtered_words.append({"word": pw, "pos": "", "meaning": ""})
-                    practice_words = filtered_words[:3]
-
-                    return {
-                        "feedback": ai_result.get("feedback", "继续练习！"),
-                        "tips": ai_result.get("tips", ""),
-                        "practice_words": practice_words,
-                        "problem_phonemes": problem_phonemes,
-                        "focus_phoneme": ai_result.get("focus_phoneme", "")
-                    }
+                _ai_feedback_cache[cache_key] = feedback
+                return feedback
 
     except Exception as e:
         print(f"AI 点评生成失败: {e}")
 
     # 失败时返回基础反馈
-    return _generate_basic_feedback(word, accuracy_score, phoneme_details)
+    return _generate_basic_feedback(word, accuracy_score, phoneme_details, problems)
 
 
-def _generate_basic_feedback(word: str, accuracy_score: float, phoneme_details: list) -> dict:
-    """生成基础反馈（无 AI 时使用）"""
+def _generate_basic_feedback(word: str, accuracy_score: float, phoneme_details: list,
+                             problems: list = None) -> dict:
+    """生成基础反馈（无 AI 时使用；problems 为已筛选的问题音素，省略时从 phoneme_details 计算）"""
     # 阈值75分，低于此分数的音素需要练习
+    if problems is None:
+        problems = _classify_phonemes(phoneme_details, 75)
     problem_phonemes = [
-        {"phoneme": p["phoneme"], "accuracy": p.get("accuracy", 0)}
-        for p in phoneme_details
-        if p.get("accuracy", 100) < 75 or p.get("error_type", "None") != "None"
+        {"phoneme": phoneme, "accuracy": accuracy}
+        for phoneme, accuracy, _ in problems
     ]
 
     # 优先根据问题音素给出反馈，而非总分
@@ -670,13 +878,13 @@ def _generate_basic_feedback(word: str, accuracy_score: float, phoneme_details:
 
 
 # 便捷函数
-async def recognize_speech(audio_data: bytes, file_ext: str = ".wav") -> dict:
+async def recognize_speech(audio_data: AudioData, file_ext: str = ".wav") -> dict:
     """识别语音的便捷函数"""
     recognizer = SpeechRecognizer()
     return await recognizer.recognize_from_bytes(audio_data, file_ext)
 
 
-async def assess_pronunciation(audio_data: bytes, reference_text: str, file_ext: str = ".wav") -> dict:
+async def assess_pronunciation(audio_data: AudioData, reference_text: str, file_ext: str = ".wav") -> dict:
     """发音评估的便捷函数"""
     assessor = PronunciationAssessor()
     return await assessor.assess_from_bytes(audio_data, reference_text, file_ext)
@@ -705,7 +913,7 @@ class QwenChineseSpeechRecognizer:
 
     async def recognize_from_bytes(
         self,
-        audio_data: bytes,
+        audio_data: AudioData,
         file_ext: str = ".wav",
         context_words: list = None
     ) -> dict:
@@ -727,17 +935,11 @@ class QwenChineseSpeechRecognizer:
         if not self.is_available():
             return {"success": False, "text": "", "error": "阿里云百炼 API 未配置"}
 
+        temp_path = None
         try:
-            import dashscope
-            from dashscope import MultiModalConversation
-
-            # 设置 API 配置
-            dashscope.api_key = self.api_key
-            dashscope.base_http_api_url = 'https://dashscope.aliyuncs.com/api/v1'
-
             # 需要将音频转换为 WAV 格式
             if file_ext in [".webm", ".ogg", ".mp4", ".m4a"]:
-                converted_data = await self._convert_to_wav(audio_data, file_ext)
+                converted_data = await _convert_to_wav(audio_data, file_ext, "[Qwen-ASR]")
                 if converted_data is None:
                     return {"success": False, "text": "", "error": "音频格式转换失败"}
                 audio_data = converted_data
@@ -745,129 +947,123 @@ class QwenChineseSpeechRecognizer:
 
             # 保存到临时文件（SDK 需要文件路径）
             with tempfile.NamedTemporaryFile(suffix=file_ext, delete=False) as f:
-                f.write(audio_data)
                 temp_path = f.name
+                f.write(audio_data)
 
-            try:
-                # 构建消息
-                messages = []
-
-                # 上下文增强（可选）- 传入相关单词可提高识别准确率
-                if context_words:
-                    context = "，".join(context_words[:10])  # 最多10个
-                    messages.append({
-                        "role": "system",
-                        "content": [{"text": f"当前学习的单词释义包括：{context}"}]
-                    })
-                else:
-                    messages.append({
-                        "role": "system",
-                        "content": [{"text": ""}]
-                    })
-
-                # 添加音频
-                messages.append({
-                    "role": "user",
-                    "content": [{"audio": f"file://{temp_path}"}]
-                })
-
-                # 在线程池中运行同步调用
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: MultiModalConversation.call(
-                        model="qwen3-asr-flash",
-                        messages=messages,
-                        result_format="message",
-                        asr_options={
-                            "language": "zh",  # 指定中文
-                            "enable_itn": True  # 启用逆文本正则化
-                        }
-                    )
-                )
-
-                if response.status_code == 200:
-                    # 提取识别结果
-                    output = response.output
-                    choices = output.get("choices", [])
-                    if choices:
-                        content = choices[0].get("message", {}).get("content", [])
-                        if content and len(content) > 0:
-                            recognized_text = content[0].get("text", "")
-                            return {
-                                "success": True,
-                                "text": recognized_text,
-                                "error": None
-                            }
-
-                    return {"success": False, "text": "", "error": "响应中无识别内容"}
-                else:
-                    return {
-                        "success": False,
-                        "text": "",
-                        "error": f"API 错误: {response.code} - {response.message}"
-                    }
-
-            finally:
+            return await self._recognize_path(temp_path, context_words)
+        except Exception as e:
+            return {"success": False, "text": "", "error": str(e)}
+        finally:
+            if temp_path:
                 try:
                     os.unlink(temp_path)
                 except:
                     pass
 
-        except ImportError:
-            return {"success": False, "text": "", "error": "dashscope SDK 未安装"}
+    async def recognize_from_file(
+        self,
+        audio_path: str,
+        file_ext: str = ".wav",
+        context_words: list = None
+    ) -> dict:
+        """
+        从已落盘的音频文件识别中文（大文件上传使用）
+
+        非 WAV 格式由 ffmpeg 直接按路径转换，整个过程不把音频读入内存
+        """
+        if not self.is_available():
+            return {"success": False, "text": "", "error": "阿里云百炼 API 未配置"}
+
+        wav_path = None
+        try:
+            if file_ext in [".webm", ".ogg", ".mp4", ".m4a"]:
+                wav_path = await _ffmpeg_to_wav_file(audio_path, "[Qwen-ASR]")
+                if wav_path is None:
+                    return {"success": False, "text": "", "error": "音频格式转换失败"}
+                audio_path = wav_path
+            return await self._recognize_path(audio_path, context_words)
         except Exception as e:
             return {"success": False, "text": "", "error": str(e)}
+        finally:
+            if wav_path:
+                try:
+                    os.unlink(wav_path)
+                except:
+                    pass
 
-    async def _convert_to_wav(self, audio_data: bytes, source_ext: str) -> Optional[bytes]:
-        """将音频转换为 WAV 格式"""
-        if len(audio_data) < 1000:
-            print(f"[Qwen-ASR] 音频数据太小: {len(audio_data)} bytes")
-            return None
+    async def _recognize_path(self, audio_path: str, context_words: list = None) -> dict:
+        """调用 Qwen3-ASR 识别本地音频文件（内部方法）"""
+        try:
+            import dashscope
+            from dashscope import MultiModalConversation
 
-        with tempfile.NamedTemporaryFile(suffix=source_ext, delete=False) as src_file:
-            src_file.write(audio_data)
-            src_path = src_file.name
+            # 设置 API 配置
+            dashscope.api_key = self.api_key
+            dashscope.base_http_api_url = 'https://dashscope.aliyuncs.com/api/v1'
 
-        dst_path = tempfile.mktemp(suffix=".wav")
+            # 构建消息
+            messages = []
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "ffmpeg",
-                "-y",
-                "-i", src_path,
-                "-acodec", "pcm_s16le",
-                "-ar", "16000",
-                "-ac", "1",
-                "-f", "wav",
-                dst_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            # 上下文增强（可选）- 传入相关单词可提高识别准确率
+            if context_words:
+                context = "，".join(context_words[:10])  # 最多10个
+                messages.append({
+                    "role": "system",
+                    "content": [{"text": f"当前学习的单词释义包括：{context}"}]
+                })
+            else:
+                messages.append({
+                    "role": "system",
+                    "content": [{"text": ""}]
+                })
+
+            # 添加音频
+            messages.append({
+                "role": "user",
+                "content": [{"audio": f"file://{audio_path}"}]
+            })
+
+            # 在语音线程池中运行同步调用
+            loop = asyncio.get_event_loop()
+            response = await loop.run_in_executor(
+                _SPEECH_POOL,
+                lambda: MultiModalConversation.call(
+                    model="qwen3-asr-flash",
+                    messages=messages,
+                    result_format="message",
+                    asr_options={
+                        "language": "zh",  # 指定中文
+                        "enable_itn": True  # 启用逆文本正则化
+                    }
+                )
             )
-            stdout, stderr = await process.communicate()
 
-            if process.returncode != 0:
-                print(f"[Qwen-ASR] FFmpeg 转换失败: {stderr.decode()}")
-                return None
+            if response.status_code == 200:
+                # 提取识别结果
+                output = response.output
+                choices = output.get("choices", [])
+                if choices:
+                    content = choices[0].get("message", {}).get("content", [])
+                    if content and len(content) > 0:
+                        recognized_text = content[0].get("text", "")
+                        return {
+                            "success": True,
+                            "text": recognized_text,
+                            "error": None
+                        }
 
-            if os.path.exists(dst_path):
-                with open(dst_path, "rb") as f:
-                    return f.read()
-            return None
+                return {"success": False, "text": "", "error": "响应中无识别内容"}
+            else:
+                return {
+                    "success": False,
+                    "text": "",
+                    "error": f"API 错误: {response.code} - {response.message}"
+                }
 
+        except ImportError:
+            return {"success": False, "text": "", "error": "dashscope SDK 未安装"}
         except Exception as e:
-            print(f"[Qwen-ASR] 音频转换异常: {e}")
-            return None
-
-        finally:
-            try:
-                os.unlink(src_path)
-            except:
-                pass
-            try:
-                os.unlink(dst_path)
-            except:
-                pass
+            return {"success": False, "text": "", "error": str(e)}
 
 
 # ==================== 阿里云百炼 Qwen3-ASR 英文语音识别 ====================
@@ -893,7 +1089,7 @@ class QwenEnglishSpeechRecognizer:
 
     async def recognize_from_bytes(
         self,
-        audio_data: bytes,
+        audio_data: AudioData,
         file_ext: str = ".wav",
         target_word: str = None
     ) -> dict:
@@ -926,7 +1122,7 @@ class QwenEnglishSpeechRecognizer:
 
             # 需要将音频转换为 WAV 格式
             if file_ext in [".webm", ".ogg", ".mp4", ".m4a"]:
-                converted_data = await self._convert_to_wav(audio_data, file_ext)
+                converted_data = await _convert_to_wav(audio_data, file_ext, "[Qwen-ASR-EN]")
                 if converted_data is None:
                     return {"success": False, "text": "", "is_correct": False, "error": "音频格式转换失败"}
                 audio_data = converted_data
@@ -959,10 +1155,10 @@ class QwenEnglishSpeechRecognizer:
                     "content": [{"audio": f"file://{temp_path}"}]
                 })
 
-                # 在线程池中运行同步调用
+                # 在语音线程池中运行同步调用
                 loop = asyncio.get_event_loop()
                 response = await loop.run_in_executor(
-                    None,
+                    _SPEECH_POOL,
                     lambda: MultiModalConversation.call(
                         model="qwen3-asr-flash",
                         messages=messages,
@@ -1016,56 +1212,6 @@ class QwenEnglishSpeechRecognizer:
         except Exception as e:
             return {"success": False, "text": "", "is_correct": False, "error": str(e)}
 
-    async def _convert_to_wav(self, audio_data: bytes, source_ext: str) -> Optional[bytes]:
-        """将音频转换为 WAV 格式"""
-        if len(audio_data) < 1000:
-            print(f"[Qwen-ASR-EN] 音频数据太小: {len(audio_data)} bytes")
-            return None
-
-        with tempfile.NamedTemporaryFile(suffix=source_ext, delete=False) as src_file:
-            src_file.write(audio_data)
-            src_path = src_file.name
-
-        dst_path = tempfile.mktemp(suffix=".wav")
-
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "ffmpeg",
-                "-y",
-                "-i", src_path,
-                "-acodec", "pcm_s16le",
-                "-ar", "16000",
-                "-ac", "1",
-                "-f", "wav",
-                dst_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
-                print(f"[Qwen-ASR-EN] FFmpeg 转换失败: {stderr.decode()}")
-                return None
-
-            if os.path.exists(dst_path):
-                with open(dst_path, "rb") as f:
-                    return f.read()
-            return None
-
-        except Exception as e:
-            print(f"[Qwen-ASR-EN] 音频转换异常: {e}")
-            return None
-
-        finally:
-            try:
-                os.unlink(src_path)
-            except:
-                pass
-            try:
-                os.unlink(dst_path)
-            except:
-                pass
-
 
 # ==================== 阿里云百炼 Qwen-Plus 翻译评价 ====================
 
@@ -1073,7 +1219,7 @@ async def generate_translation_feedback(
     english: str,
     reference: str,
     user_text: str,
-    similarity: float = 0.0
+    similarity: float = None
 ) -> dict:
     """
     使用阿里云百炼 Qwen-Plus 评价翻译结果
@@ -1082,7 +1228,7 @@ async def generate_translation_feedback(
         english: 英文原文
         reference: 标准中文翻译
         user_text: 用户说的中文
-        similarity: 文本相似度（0-1）
+        similarity: 文本相似度（0-1），仅降级评价时使用，None 时按需计算
 
     Returns:
         {
@@ -1092,9 +1238,6 @@ async def generate_translation_feedback(
             "suggestion": "改进建议"
         }
     """
-    import httpx
-    import json
-
     api_key = os.getenv("DASHSCOPE_API_KEY")
     if not api_key:
         # 无 API Key，使用简单判断
@@ -1127,64 +1270,61 @@ async def generate_translation_feedback(
 - 只有明显错误才判定为不正确"""
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.post(
-                base_url,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "qwen-plus",
-                    "messages": [
-                        {"role": "system", "content": "你是翻译评估助手，客观简洁地评价翻译结果。只回复JSON，不要任何解释。"},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 150
-                }
-            )
+        client = _get_http_client()
+        response = await client.post(
+            base_url,
+            timeout=15.0,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "qwen-plus",
+                "messages": [
+                    {"role": "system", "content": "你是翻译评估助手，客观简洁地评价翻译结果。只回复JSON，不要任何解释。"},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.3,
+                "max_tokens": 150,
+                "response_format": {"type": "json_object"}
+            }
+        )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
+        if response.status_code == 200:
+            result = json_loads(response.content)
+            content = result["choices"][0]["message"]["content"]
 
-                # 解析 JSON
-                try:
-                    # 提取 JSON 部分
-                    if "```json" in content:
-                        json_str = content.split("```json")[1].split("```")[0].strip()
-                    elif "```" in content:
-                        json_str = content.split("```")[1].split("```")[0].strip()
-                    else:
-                        json_str = content.strip()
-
-                    parsed = json.loads(json_str)
-                    return {
-                        "correct": parsed.get("correct", False),
-                        "feedback": parsed.get("feedback", ""),
-                        "issues": parsed.get("issues", []),
-                        "suggestion": parsed.get("suggestion", "")
-                    }
-                except json.JSONDecodeError:
-                    # JSON 解析失败，尝试从文本判断
-                    is_correct = "正确" in content or "correct" in content.lower()
-                    return {
-                        "correct": is_correct,
-                        "feedback": content[:20] if content else "评价生成失败",
-                        "issues": [],
-                        "suggestion": ""
-                    }
-            else:
-                print(f"[Qwen-Plus] API 错误: {response.status_code}")
-                return _simple_translation_feedback(reference, user_text, similarity)
+            # 解析 JSON
+            try:
+                # 提取 JSON 部分（去掉可能的 markdown 代码块）
+                json_str = strip_fence(content)
+
+                parsed = json_loads(json_str)
+                return {
+                    "correct": parsed.get("correct", False),
+                    "feedback": parsed.get("feedback", ""),
+                    "issues": parsed.get("issues", []),
+                    "suggestion": parsed.get("suggestion", "")
+                }
+            except json.JSONDecodeError:
+                # JSON 解析失败，尝试从文本判断
+                is_correct = "正确" in content or "correct" in content.lower()
+                return {
+                    "correct": is_correct,
+                    "feedback": content[:20] if content else "评价生成失败",
+                    "issues": [],
+                    "suggestion": ""
+                }
+        else:
+            print(f"[Qwen-Plus] API 错误: {response.status_code}")
+            return _simple_translation_feedback(reference, user_text, similarity)
 
     except Exception as e:
         print(f"[Qwen-Plus] 翻译评价异常: {e}")
         return _simple_translation_feedback(reference, user_text, similarity)
 
 
-def _simple_translation_feedback(reference: str, user_text: str, similarity: float) -> dict:
+def _simple_translation_feedback(reference: str, user_text: str, similarity: float = None) -> dict:
     """简单的翻译评价（无 AI 时使用）"""
     # 简单的文本相似度判断
     if not user_text:
@@ -1196,6 +1336,8 @@ def _simple_translation_feedback(reference: str, user_text: str, similarity: flo
         }
 
     # 计算简单相似度
+    if similarity is None:
+        similarity = calculate_text_similarity(reference, user_text)
     if similarity == 0:
         # 简单的字符重叠率
         ref_chars = set(reference)
@@ -1247,9 +1389,6 @@ async def evaluate_passage_translation(
             "suggestion": "改进建议"
         }
     """
-    import httpx
-    import json
-
     api_key = os.getenv("DASHSCOPE_API_KEY")
     if not api_key:
         # 无 API Key，返回简单评估
@@ -1294,53 +1433,50 @@ async def evaluate_passage_translation(
 - 建议要具体可操作"""
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                base_url,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "qwen-plus",
-                    "messages": [
-                        {"role": "system", "content": "你是翻译评估专家。只回复JSON，不要任何解释。"},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 500
-                }
-            )
+        client = _get_http_client()
+        response = await client.post(
+            base_url,
+            timeout=30.0,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "qwen-plus",
+                "messages": [
+                    {"role": "system", "content": "你是翻译评估专家。只回复JSON，不要任何解释。"},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.3,
+                "max_tokens": 500,
+                "response_format": {"type": "json_object"}
+            }
+        )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
+        if response.status_code == 200:
+            result = json_loads(response.content)
+            content = result["choices"][0]["message"]["content"]
 
-                # 解析 JSON
-                try:
-                    # 提取 JSON 部分
-                    if "```json" in content:
-                        json_str = content.split("```json")[1].split("```")[0].strip()
-                    elif "```" in content:
-                        json_str = content.split("```")[1].split("```")[0].strip()
-                    else:
-                        json_str = content.strip()
-
-                    parsed = json.loads(json_str)
-                    return {
-                        "reference_translation": parsed.get("reference_translation", ""),
-                        "score": int(parsed.get("score", 0)),
-                        "feedback": parsed.get("feedback", ""),
-                        "strengths": parsed.get("strengths", []),
-                        "issues": parsed.get("issues", []),
-                        "suggestion": parsed.get("suggestion", "")
-                    }
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"[短文翻译] JSON 解析失败: {e}, 原始内容: {content[:200]}")
-                    return _simple_passage_evaluation(english_passage, user_translation)
-            else:
-                print(f"[短文翻译] API 错误: {response.status_code}")
+            # 解析 JSON
+            try:
+                # 提取 JSON 部分（去掉可能的 markdown 代码块）
+                json_str = strip_fence(content)
+
+                parsed = json_loads(json_str)
+                return {
+                    "reference_translation": parsed.get("reference_translation", ""),
+                    "score": int(parsed.get("score", 0)),
+                    "feedback": parsed.get("feedback", ""),
+                    "strengths": parsed.get("strengths", []),
+                    "issues": parsed.get("issues", []),
+                    "suggestion": parsed.get("suggestion", "")
+                }
+            except (json.JSONDecodeError, ValueError) as e:
+                print(f"[短文翻译] JSON 解析失败: {e}, 原始内容: {content[:200]}")
                 return _simple_passage_evaluation(english_passage, user_translation)
+        else:
+            print(f"[短文翻译] API 错误: {response.status_code}")
+            return _simple_passage_evaluation(english_passage, user_translation)
 
     except Exception as e:
         print(f"[短文翻译] 评估异常: {e}")
@@ -1390,13 +1526,23 @@ def _simple_passage_evaluation(english_passage: str, user_translation: str) -> d
     }
 
 
+# 计算相似度前删除的字符
+_SIMILARITY_STRIP = str.maketrans("", "", " ，。")
+
+
+@lru_cache(maxsize=8192)
+def _reference_chars(text: str) -> frozenset:
+    """参考译文的字符集合（同一单词反复练习时参考译文不变，缓存后只需处理用户一侧）"""
+    return frozenset(text.translate(_SIMILARITY_STRIP))
+
+
 def calculate_text_similarity(text1: str, text2: str) -> float:
     """
     计算两个中文文本的相似度
 
     Args:
-        text1: 文本1
-        text2: 文本2
+        text1: 文本1（参考译文，字符集合会被缓存）
+        text2: 文本2（用户译文）
 
     Returns:
         相似度 (0-1)
@@ -1404,21 +1550,25 @@ def calculate_text_similarity(text1: str, text2: str) -> float:
     if not text1 or not text2:
         return 0.0
 
-    # 简单的字符级别相似度
-    chars1 = set(text1.replace(" ", "").replace("，", "").replace("。", ""))
-    chars2 = set(text2.replace(" ", "").replace("，", "").replace("。", ""))
+    # 简单的字符级别相似度（Jaccard），一次 translate 去掉空格和标点
+    chars1 = _reference_chars(text1)
+
+    # 用户原样说出参考译文（重试时很常见），无需再计算
+    if text1 == text2:
+        return 1.0 if chars1 else 0.0
+
+    chars2 = set(text2.translate(_SIMILARITY_STRIP))
 
     if not chars1 or not chars2:
         return 0.0
 
+    # |A ∪ B| = |A| + |B| - |A ∩ B|，不必再构造并集
     intersection = len(chars1 & chars2)
-    union = len(chars1 | chars2)
-
-    return intersection / union if union > 0 else 0.0
+    return intersection / (len(chars1) + len(chars2) - intersection)
 
 
 # 便捷函数
-async def recognize_chinese_speech(audio_data: bytes, file_ext: str = ".wav") -> dict:
+async def recognize_chinese_speech(audio_data: AudioData, file_ext: str = ".wav") -> dict:
     """识别中文语音的便捷函数"""
     recognizer = QwenChineseSpeechRecognizer()
     return await recognizer.recognize_from_bytes(audio_data, file_ext)
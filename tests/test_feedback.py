@@ -0,0 +1,60 @@
+"""
+发音反馈分类测试
+
+测试内容：
+1. speech._classify_phonemes / generate_feedback_text：缺少 error_type 的音素
+2. server._partition_word_scores：缺少 error_type 的单词按无错误处理
+
+使用方法：
+    cd english-learning-app
+    python -m pytest tests/test_feedback.py -q
+"""
+
+import sys
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import server
+from speech import _classify_phonemes, generate_feedback_text
+
+
+# ==================== 音素分类 ====================
+
+def test_classify_phonemes_missing_error_type_defaults_to_no_error():
+    details = [{"phoneme": "h", "accuracy": 90}, {"phoneme": "e", "accuracy": 50}]
+    assert _classify_phonemes(details, 75) == [("e", 50, "None")]
+
+
+def test_classify_phonemes_missing_error_type_as_problem():
+    details = [{"phoneme": "h", "accuracy": 90}, {"phoneme": "e", "accuracy": 50}]
+    assert _classify_phonemes(details, 60, None) == [("h", 90, None), ("e", 50, None)]
+
+
+def test_feedback_text_counts_phonemes_missing_error_type():
+    result = {
+        "success": True,
+        "accuracy_score": 70,
+        "phoneme_details": [
+            {"phoneme": "h", "accuracy": 90},
+            {"phoneme": "e", "accuracy": 95, "error_type": "None"},
+        ],
+    }
+    assert generate_feedback_text(result, "he") == "还可以，注意 h 的发音。"
+
+
+# ==================== 句子单词分组 ====================
+
+def test_partition_word_scores_missing_error_type():
+    word_scores = [
+        {"word": "good", "accuracy": 95},
+        {"word": "fair", "accuracy": 70},
+        {"word": "bad", "accuracy": 40},
+        {"word": "gone", "accuracy": 0, "error_type": "Omission"},
+        {"word": "wrong", "accuracy": 85, "error_type": "Mispronunciation"},
+    ]
+    problem_words, omitted_words, mispronounced_words = server._partition_word_scores(word_scores)
+    assert problem_words == [{"word": "fair", "accuracy": 70}]
+    assert omitted_words == ["gone"]
+    assert mispronounced_words == [{"word": "bad", "accuracy": 40}, {"word": "wrong", "accuracy": 85}]
@@ -0,0 +1,46 @@
+"""
+选择题干扰项抽样测试
+
+测试内容：
+1. server._iter_shuffled：产出 pool 的一个排列
+2. server._sample_distractors：重复单词和被拒绝的单词不占名额
+
+使用方法：
+    cd english-learning-app
+    python -m pytest tests/test_quiz_options.py -q
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import server
+
+
+def _words(*names):
+    return [SimpleNamespace(word=name) for name in names]
+
+
+def test_iter_shuffled_is_permutation():
+    pool = list(range(50))
+    for _ in range(20):
+        assert sorted(server._iter_shuffled(pool)) == pool
+
+
+def test_sample_distractors_skips_duplicates():
+    # 重复单词远多于 k + len(reject)，仍应凑足 3 个不同的干扰项
+    pool = _words(*(["apple"] * 30 + ["Apple"] * 10 + ["happy"] * 20 + ["banana", "cherry"]))
+    for _ in range(50):
+        reject = {"happy"}
+        picked = server._sample_distractors(pool, 3, reject)
+        assert sorted(w.lower() for w in picked) == ["apple", "banana", "cherry"]
+        assert reject == {"happy", "apple", "banana", "cherry"}
+
+
+def test_sample_distractors_pool_exhausted():
+    pool = _words("happy", "apple", "apple")
+    assert server._sample_distractors(pool, 3, {"happy"}) == ["apple"]
+    assert server._sample_distractors(pool, 0, set()) == []
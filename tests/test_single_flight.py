@@ -0,0 +1,233 @@
+"""
+单飞（single-flight）与 TTS 缓存写入测试
+
+测试内容：
+1. server._coalesce：成功、异常、执行者被取消
+2. TTSService.synthesize：并发合成只调用一次引擎、发起者被取消或出错
+   TTSService.stream：并发流式请求共享一次合成、首块前失败返回 None
+3. TTSCache.put：原子写入，失败不留下文件
+
+使用方法：
+    cd english-learning-app
+    python -m pytest tests/test_single_flight.py -q
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import server
+from tts import TTSCache, TTSService
+
+
+class FakeEngine:
+    """假 TTS 引擎：记录调用次数，合成耗时可控"""
+
+    DEFAULT_ENGLISH_VOICE_ID = "us-male"
+    name = "fake"
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    async def synthesize(self, **kwargs) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return b"ID3-fake-mp3"
+
+    async def stream(self, **kwargs):
+        self.calls += 1
+        for chunk in (b"ID3-", b"fake-", b"mp3"):
+            await asyncio.sleep(self.delay / 3)
+            yield chunk
+
+
+class FailingEngine(FakeEngine):
+    """首块音频之前就失败的引擎"""
+
+    async def stream(self, **kwargs):
+        self.calls += 1
+        raise RuntimeError("connection reset")
+        yield b""
+
+
+# ==================== _coalesce ====================
+
+def test_coalesce_shares_result():
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"sentence": "ok"}
+
+    async def main():
+        return await asyncio.gather(*(server._coalesce("k-success", factory) for _ in range(3)))
+
+    results = asyncio.run(main())
+    assert results == [{"sentence": "ok"}] * 3
+    assert calls == 1
+    assert "k-success" not in server._inflight
+
+
+def test_coalesce_shares_exception():
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            *(server._coalesce("k-error", factory) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert calls == 1
+    assert "k-error" not in server._inflight
+
+
+def test_coalesce_leader_cancelled_waiter_reruns():
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return calls
+
+    async def main():
+        leader = asyncio.create_task(server._coalesce("k-cancel", factory))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(server._coalesce("k-cancel", factory))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    assert asyncio.run(main()) == 2
+    assert "k-cancel" not in server._inflight
+
+
+# ==================== TTS 单飞合成 ====================
+
+def test_tts_synthesize_single_flight(tmp_path):
+    service = TTSService(tmp_path)
+    service.engine = FakeEngine()
+
+    async def main():
+        return await asyncio.gather(*(service.synthesize("hello", cache_key="k") for _ in range(3)))
+
+    paths = asyncio.run(main())
+    assert paths == [tmp_path / "k.mp3"] * 3
+    assert service.engine.calls == 1
+    assert not service._inflight
+
+
+def test_tts_synthesize_leader_cancelled(tmp_path):
+    service = TTSService(tmp_path)
+    service.engine = FakeEngine()
+
+    async def main():
+        leader = asyncio.create_task(service.synthesize("hello", cache_key="k"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(service.synthesize("hello", cache_key="k"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await waiter
+
+    assert asyncio.run(main()) == tmp_path / "k.mp3"
+    assert service.engine.calls == 2
+    assert not service._inflight
+
+
+def test_tts_synthesize_leader_error_releases_waiters(tmp_path):
+    service = TTSService(tmp_path)
+    service.engine = FakeEngine()
+    original = service._synthesize_to_cache
+    calls = 0
+
+    async def failing_once(*args):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        if calls == 1:
+            raise OSError("disk full")
+        return await original(*args)
+
+    service._synthesize_to_cache = failing_once
+
+    async def main():
+        leader = asyncio.create_task(service.synthesize("hello", cache_key="k"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(service.synthesize("hello", cache_key="k"))
+        with pytest.raises(OSError):
+            await leader
+        return await asyncio.wait_for(waiter, timeout=1)
+
+    assert asyncio.run(main()) == tmp_path / "k.mp3"
+    assert not service._inflight
+
+
+async def _read_all(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+def test_tts_stream_shared(tmp_path):
+    service = TTSService(tmp_path)
+    service.engine = FakeEngine()
+
+    async def main():
+        streams = await asyncio.gather(*(service.stream("hello", cache_key="k") for _ in range(2)))
+        return await asyncio.gather(*(_read_all(s) for s in streams))
+
+    assert asyncio.run(main()) == [b"ID3-fake-mp3"] * 2
+    assert service.engine.calls == 1
+    assert (tmp_path / "k.mp3").read_bytes() == b"ID3-fake-mp3"
+    assert not service._inflight and not service._streams
+
+
+def test_tts_stream_failure_returns_none(tmp_path):
+    service = TTSService(tmp_path)
+    service.engine = FailingEngine()
+
+    assert asyncio.run(service.stream("hello", cache_key="k")) is None
+    assert service.cache.get("k") is None
+    assert not service._inflight and not service._streams
+
+
+# ==================== TTS 缓存写入 ====================
+
+def test_cache_put_is_atomic(tmp_path):
+    cache = TTSCache(tmp_path)
+    path = asyncio.run(cache.put("k", b"ID3-audio"))
+    assert path.read_bytes() == b"ID3-audio"
+    assert cache.get("k") == path
+    assert os.listdir(tmp_path) == ["k.mp3"]
+
+
+def test_cache_put_failure_leaves_no_file(tmp_path, monkeypatch):
+    cache = TTSCache(tmp_path)
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        asyncio.run(cache.put("k", b"ID3-audio"))
+    assert cache.get("k") is None
+    assert os.listdir(tmp_path) == []
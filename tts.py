@@ -28,16 +28,21 @@ Usage:
 """
 
 import os
+import asyncio
 import hashlib
 import tempfile
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 
 import pyphen  # 音节分割库
 
 logger = logging.getLogger(__name__)
 
+# 单飞合成的发起者被取消时写入共享 Future 的标记：等待者不随之取消，而是自己重新合成
+_RETRY = object()
+
 
 # ==================== Edge-TTS 引擎 ====================
 
@@ -162,6 +167,32 @@ class EdgeTTSEngine:
                 pass
             return None
 
+    async def stream(
+        self,
+        text: str,
+        language: str = "en",
+        speed: str = "normal",
+        voice_id: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        流式合成语音，边合成边产出 MP3 数据块
+
+        Args:
+            同 synthesize
+
+        Yields:
+            MP3 音频数据块
+        """
+        import edge_tts
+
+        voice = self.resolve_voice(language, voice_id)
+        rate = self.RATE_MAP.get(speed, "+0%")
+
+        communicate = edge_tts.Communicate(text, voice, rate=rate)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
     def split_syllables(self, word: str) -> List[str]:
         """
         将单词分割为音节
@@ -290,18 +321,18 @@ class TTSCache:
         生成缓存 key
 
         短文本（≤30字符且纯字母/空格）使用原文作为 key，方便调试。
-        长文本或含特殊字符的使用 MD5 哈希。
+        长文本或含特殊字符的使用 BLAKE2b 内容哈希（64 位）。
         voice_id 用于区分不同英文音色的缓存。
         """
         safe = text.strip().lower()
         # 音色前缀：英文带 voice_id，中文不需要
         voice_prefix = f"{voice_id}_" if voice_id else ""
 
-        if len(safe) <= 30 and all(c.isalpha() or c.isspace() for c in safe):
+        if len(safe) <= 30 and safe.replace(" ", "").isalpha():
             file_safe = safe.replace(" ", "_")
             return f"{language}_{voice_prefix}{speed}_{file_safe}"
         else:
-            text_hash = hashlib.md5(safe.encode()).hexdigest()[:12]
+            text_hash = hashlib.blake2b(safe.encode("utf-8"), digest_size=8).hexdigest()
             return f"{language}_{voice_prefix}{speed}_{text_hash}"
 
     def get(self, cache_key: str) -> Optional[Path]:
@@ -312,11 +343,76 @@ class TTSCache:
         return None
 
     async def put(self, cache_key: str, audio_data: bytes) -> Path:
-        """写入缓存文件并返回路径"""
+        """写入缓存文件并返回路径（线程池写盘，不阻塞事件循环）"""
         cache_file = self.cache_dir / f"{cache_key}.mp3"
-        cache_file.write_bytes(audio_data)
+        await asyncio.to_thread(self._write_atomic, cache_file, audio_data)
         return cache_file
 
+    def _write_atomic(self, cache_file: Path, audio_data: bytes) -> None:
+        """先写同目录临时文件再原子替换，写盘期间 get() 不会拿到写了一半的文件"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio_data)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+# ==================== 流式合成 ====================
+
+class _SynthesisStream:
+    """
+    一次进行中的流式合成
+
+    后台任务从引擎读取音频块追加到缓冲区，各客户端按自己的速度从缓冲区读取，
+    慢客户端不会拖住合成并发名额；同一句子的并发请求共享同一个缓冲区。
+    """
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.finished = False
+        self.failed = False
+        self.task: Optional[asyncio.Task] = None
+        self._cond = asyncio.Condition()
+
+    async def append(self, chunk: bytes) -> None:
+        async with self._cond:
+            self.chunks.append(chunk)
+            self._cond.notify_all()
+
+    async def finish(self, failed: bool = False) -> None:
+        async with self._cond:
+            self.finished = True
+            self.failed = failed
+            self._cond.notify_all()
+
+    async def wait_for(self, index: int) -> bool:
+        """等到第 index 块可读或合成结束；有第 index 块返回 True"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: len(self.chunks) > index or self.finished)
+        return len(self.chunks) > index
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """从头读取全部音频块；合成中途失败时抛出异常，让连接异常结束而不是返回截断的音频"""
+        index = 0
+        while await self.wait_for(index):
+            end = len(self.chunks)
+            for chunk in self.chunks[index:end]:
+                yield chunk
+            index = end
+        if self.failed:
+            raise RuntimeError("流式合成中断")
+
+
+async def _iter_bytes(data: bytes) -> AsyncIterator[bytes]:
+    """把整段音频包装为单块异步迭代器（与流式返回值保持同一接口）"""
+    yield data
+
 
 # ==================== TTS 服务（门面） ====================
 
@@ -327,9 +423,23 @@ class TTSService:
     统一入口，管理缓存，调用 Edge-TTS 引擎。
     """
 
+    # 内存 LRU 缓存条数（单词音频约 10KB，512 条约 5MB）
+    MEMORY_CACHE_SIZE = 512
+    # 超过该大小的音频（长句/段落）不进内存 LRU，避免少数大文件挤占缓存
+    MEMORY_MAX_ITEM_BYTES = 256 * 1024
+    # 同时进行的引擎合成数上限（突发请求排队，避免同时打开过多 Edge-TTS 连接被限流）
+    MAX_CONCURRENT_SYNTH = 8
+
     def __init__(self, cache_dir: Path):
         self.engine = EdgeTTSEngine()
         self.cache = TTSCache(cache_dir)
+        # 热门音频字节的内存 LRU：cache_key -> MP3 bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        # 正在合成的任务：cache_key -> Future，同一音频并发请求只合成一次
+        self._inflight: dict[str, asyncio.Future] = {}
+        # 正在进行的流式合成：cache_key -> _SynthesisStream（同时登记在 _inflight 中）
+        self._streams: dict[str, _SynthesisStream] = {}
+        self._synth_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SYNTH)
 
     async def synthesize(
         self,
@@ -337,6 +447,7 @@ class TTSService:
         language: str = "en",
         speed: str = "normal",
         voice_id: Optional[str] = None,
+        cache_key: Optional[str] = None,
     ) -> Optional[Path]:
         """
         合成语音并返回缓存文件路径
@@ -348,6 +459,7 @@ class TTSService:
             language: "en" | "zh"
             speed: "slow" | "normal" | "moderate"
             voice_id: 英文音色 ID（如 "us-male", "gb-female"），仅对英文有效
+            cache_key: 调用方已算好的缓存 key（如用于 ETag），传入则不再重复计算
 
         Returns:
             音频文件 Path，失败时返回 None
@@ -355,29 +467,51 @@ class TTSService:
         if not text or not text.strip():
             return None
 
-        # 确定实际 voice_id（英文默认 us-male，中文忽略）
-        effective_voice_id = ""
-        if language == "en":
-            effective_voice_id = voice_id or self.engine.DEFAULT_ENGLISH_VOICE_ID
-
         # 1. 查缓存
-        cache_key = self.cache.make_key(text, language, speed, effective_voice_id)
+        if cache_key is None:
+            cache_key = self.make_key(text, language, speed, voice_id)
         cached = self.cache.get(cache_key)
         if cached:
             return cached
 
-        # 2. 合成
+        # 2. 已有相同合成在进行：等待其结果（发起者被取消时重新检查，由某个等待者接手合成）
+        while (fut := self._inflight.get(cache_key)) is not None:
+            path = await asyncio.shield(fut)
+            if path is not _RETRY:
+                return path
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = fut
+        # 被取消或抛出异常时等待者收到 _RETRY，自行重新合成，不会永远等待
+        path = _RETRY
+        try:
+            path = await self._synthesize_to_cache(text, language, speed, voice_id, cache_key)
+            return path
+        finally:
+            self._inflight.pop(cache_key, None)
+            fut.set_result(path)
+
+    async def _synthesize_to_cache(
+        self,
+        text: str,
+        language: str,
+        speed: str,
+        voice_id: Optional[str],
+        cache_key: str,
+    ) -> Optional[Path]:
+        """调用引擎合成并写入文件缓存，失败返回 None"""
         if not self.engine.is_available():
             logger.error("[TTS] Edge-TTS 不可用")
             return None
 
         try:
-            audio_data = await self.engine.synthesize(
-                text=text,
-                language=language,
-                speed=speed,
-                voice_id=voice_id,
-            )
+            async with self._synth_semaphore:
+                audio_data = await self.engine.synthesize(
+                    text=text,
+                    language=language,
+                    speed=speed,
+                    voice_id=voice_id,
+                )
             if audio_data:
                 path = await self.cache.put(cache_key, audio_data)
                 logger.info("[TTS] 合成成功: %s...", text[:30])
@@ -387,6 +521,169 @@ class TTSService:
 
         return None
 
+    async def synthesize_bytes(
+        self,
+        text: str,
+        language: str = "en",
+        speed: str = "normal",
+        voice_id: Optional[str] = None,
+        cache_key: Optional[str] = None,
+    ) -> Optional[bytes]:
+        """
+        合成语音并返回 MP3 字节
+
+        内存 LRU → 文件缓存 → 合成。热门单词/反馈短语直接从内存返回，不再 stat/打开文件。
+
+        Returns:
+            MP3 音频字节，失败时返回 None
+        """
+        if not text or not text.strip():
+            return None
+
+        if cache_key is None:
+            cache_key = self.make_key(text, language, speed, voice_id)
+        audio_data = self._memory.get(cache_key)
+        if audio_data is not None:
+            self._memory.move_to_end(cache_key)
+            return audio_data
+
+        path = await self.synthesize(
+            text=text, language=language, speed=speed, voice_id=voice_id, cache_key=cache_key
+        )
+        if path is None:
+            return None
+
+        audio_data = await asyncio.to_thread(path.read_bytes)
+        if len(audio_data) <= self.MEMORY_MAX_ITEM_BYTES:
+            self._memory[cache_key] = audio_data
+            if len(self._memory) > self.MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+        return audio_data
+
+    def get_cached(
+        self,
+        text: str,
+        language: str = "en",
+        speed: str = "normal",
+        voice_id: Optional[str] = None,
+        cache_key: Optional[str] = None,
+    ) -> Optional[Path]:
+        """只查文件缓存，命中返回路径，未命中返回 None（不触发合成）"""
+        if not text or not text.strip():
+            return None
+        if cache_key is None:
+            cache_key = self.make_key(text, language, speed, voice_id)
+        return self.cache.get(cache_key)
+
+    async def stream(
+        self,
+        text: str,
+        language: str = "en",
+        speed: str = "normal",
+        voice_id: Optional[str] = None,
+        cache_key: Optional[str] = None,
+    ) -> Optional[AsyncIterator[bytes]]:
+        """
+        流式合成语音（用于未命中缓存的长句，首块音频到达即可开始播放）
+
+        合成在后台任务中进行，只在读取引擎输出期间占用合成并发名额；
+        同一音频的并发请求共享同一次合成，并登记到 _inflight，synthesize() 也会等待它。
+        合成完整结束后写入文件缓存，之后的请求直接走缓存；中途失败不写缓存。
+
+        Returns:
+            MP3 音频块的异步迭代器；首块音频到达前失败或没有音频时返回 None
+        """
+        if not text or not text.strip():
+            return None
+
+        if cache_key is None:
+            cache_key = self.make_key(text, language, speed, voice_id)
+
+        synthesis = self._streams.get(cache_key)
+        if synthesis is None:
+            if cache_key in self._inflight or self.cache.get(cache_key):
+                # 已有缓存或整段合成在进行：等它写入缓存后整段返回
+                path = await self.synthesize(
+                    text=text, language=language, speed=speed, voice_id=voice_id, cache_key=cache_key
+                )
+                if path is None:
+                    return None
+                return _iter_bytes(await asyncio.to_thread(path.read_bytes))
+
+            if not self.engine.is_available():
+                logger.error("[TTS] Edge-TTS 不可用")
+                return None
+            synthesis = self._start_stream(text, language, speed, voice_id, cache_key)
+
+        if not await synthesis.wait_for(0):
+            return None
+        return synthesis.iter_chunks()
+
+    def _start_stream(
+        self,
+        text: str,
+        language: str,
+        speed: str,
+        voice_id: Optional[str],
+        cache_key: str,
+    ) -> _SynthesisStream:
+        """登记并启动后台流式合成任务"""
+        synthesis = _SynthesisStream()
+        fut = asyncio.get_running_loop().create_future()
+        self._streams[cache_key] = synthesis
+        self._inflight[cache_key] = fut
+        synthesis.task = asyncio.create_task(
+            self._run_stream(synthesis, fut, text, language, speed, voice_id, cache_key)
+        )
+        return synthesis
+
+    async def _run_stream(
+        self,
+        synthesis: _SynthesisStream,
+        fut: asyncio.Future,
+        text: str,
+        language: str,
+        speed: str,
+        voice_id: Optional[str],
+        cache_key: str,
+    ) -> None:
+        """后台任务：读取引擎输出写入缓冲区，完成后写入文件缓存"""
+        path = None
+        failed = True
+        try:
+            async with self._synth_semaphore:
+                async for chunk in self.engine.stream(
+                    text=text,
+                    language=language,
+                    speed=speed,
+                    voice_id=voice_id,
+                ):
+                    await synthesis.append(chunk)
+            failed = False
+            if synthesis.chunks:
+                path = await self.cache.put(cache_key, b"".join(synthesis.chunks))
+                logger.info("[TTS] 流式合成成功: %s...", text[:30])
+        except Exception as e:
+            logger.warning("[TTS] 流式合成失败: %s", e)
+        finally:
+            await synthesis.finish(failed)
+            self._streams.pop(cache_key, None)
+            self._inflight.pop(cache_key, None)
+            if not fut.done():
+                fut.set_result(path)
+
+    def make_key(self, text: str, language: str, speed: str, voice_id: Optional[str] = None) -> str:
+        """生成缓存 key（英文默认 us-male 音色，中文忽略音色）"""
+        effective_voice_id = ""
+        if language == "en":
+            effective_voice_id = voice_id or self.engine.DEFAULT_ENGLISH_VOICE_ID
+        return self.cache.make_key(text, language, speed, effective_voice_id)
+
+    def make_syllables_key(self, word: str, voice_id: Optional[str] = None) -> str:
+        """生成音节拼读音频的缓存 key"""
+        effective_voice_id = voice_id or self.engine.DEFAULT_ENGLISH_VOICE_ID
+        return f"syllables_{effective_voice_id}_{word.lower()}"
+
     def get_english_voices(self) -> list[dict]:
         """返回可用的英文音色列表"""
         return [
@@ -436,11 +733,8 @@ class TTSService:
         if not word or not word.strip():
             return None
 
-        # 确定实际 voice_id
-        effective_voice_id = voice_id or self.engine.DEFAULT_ENGLISH_VOICE_ID
-
         # 1. 查缓存（使用 syllables 前缀区分）
-        cache_key = f"syllables_{effective_voice_id}_{word.lower()}"
+        cache_key = self.make_syllables_key(word, voice_id)
         cached = self.cache.get(cache_key)
         if cached:
             return cached
@@ -471,13 +765,15 @@ _tts_service: Optional[TTSService] = None
 
 
 def init_tts_service(cache_dir: Path) -> TTSService:
-    """初始化全局 TTS 服务（在 server.py 启动时调用）"""
+    """
+    初始化全局 TTS 服务（在 server.py 导入时调用）
+
+    不在此处探测引擎（会导入 edge_tts）：由应用启动钩子在线程池中预加载，
+    或在首次合成时按需探测
+    """
     global _tts_service
     _tts_service = TTSService(cache_dir)
-    logger.info(
-        "[TTS] 服务初始化完成，引擎: %s",
-        _tts_service.get_active_engine_name() or "不可用",
-    )
+    logger.info("[TTS] 服务初始化完成，缓存目录: %s", cache_dir)
     return _tts_service
 
 